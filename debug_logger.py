@@ -26,10 +26,15 @@ logging.basicConfig(
 # Create a specific logger for our debug output
 debug_logger = logging.getLogger('MINITREK_DEBUG')
 
+# Echo debug messages to the console as well as the log file. Off by default:
+# log_debug runs on every system arrival and scan, and console writes are slow
+DEBUG_CONSOLE = False
+
 def log_debug(message):
-    """Log a debug message to both file and console"""
+    """Log a debug message to the log file (and the console if DEBUG_CONSOLE is set)"""
     debug_logger.info(message)
-    print(f"[DEBUG] {message}")  # Also print for immediate visibility
+    if DEBUG_CONSOLE:
+        print(f"[DEBUG] {message}")  # Also print for immediate visibility
 
 def get_log_path():
     """Get the current log file path"""
@@ -1,9 +1,51 @@
 class MapObject:
+    __slots__ = ('type', 'q', 'r', 'props', 'system_q', 'system_r', 'color',
+                 # Rendering state attached by the system map
+                 'star_image', 'scaled_star_image', 'current_rotation', 'target_rotation',
+                 'prev_render_px', 'prev_render_py', 'prev_anim_x', 'prev_anim_y',
+                 'last_system_dest_q', 'last_system_dest_r', 'anim_px', 'anim_py',
+                 # Enemy status shown in the scan popups
+                 'health', 'max_health', 'energy', 'max_energy', 'shields', 'max_shields',
+                 'weapons_status', 'engine_status', 'distance', 'bearing',
+                 'power_allocation', 'system_integrity', 'ship_name', 'ship_class')
+
     def __init__(self, obj_type, q, r, **props):
         self.type = obj_type  # e.g., 'star', 'planet', 'enemy', etc.
         self.q = q  # Axial coordinate q
         self.r = r  # Axial coordinate r
         self.props = props  # Additional properties (dict)
+        self.system_q = None  # Position on the system map, assigned on placement
+        self.system_r = None
+        self.color = None  # Fallback draw color, assigned when first drawn
+        # Star sprite, chosen and scaled on first draw
+        self.star_image = None
+        self.scaled_star_image = None
+        # Ship sprite heading and the positions it is derived from
+        self.current_rotation = None
+        self.target_rotation = None
+        self.prev_render_px = None
+        self.prev_render_py = None
+        self.prev_anim_x = None
+        self.prev_anim_y = None
+        self.last_system_dest_q = None
+        self.last_system_dest_r = None
+        self.anim_px = None  # Animated pixel position, when one is tracked
+        self.anim_py = None
+        # Enemy status, filled in when the enemy is first scanned
+        self.health = None
+        self.max_health = None
+        self.energy = None
+        self.max_energy = None
+        self.shields = None
+        self.max_shields = None
+        self.weapons_status = None
+        self.engine_status = None
+        self.distance = None
+        self.bearing = None
+        self.power_allocation = None
+        self.system_integrity = None
+        self.ship_name = None
+        self.ship_class = None
 
     @property
     def faction(self):
@@ -14,4 +56,53 @@ class MapObject:
         return (
             f"<MapObject type={self.type} q={self.q} r={self.r} "
             f"props={self.props}>"
-        ) 
\ No newline at end of file
+        )
+
+# Objects grouped by type per system: system -> (object list, {type: [objects]})
+_system_type_index = {}
+
+
+def get_system_objects_by_type(systems, system):
+    """Return {type: [objects]} for a system, grouping its object list on first use.
+
+    The grouping is kept until the system's list is replaced, or until objects
+    are added or removed through add_system_object / remove_system_object.
+    """
+    system_objects = systems.get(system, [])
+    cached = _system_type_index.get(system)
+    if cached is not None and cached[0] is system_objects:
+        return cached[1]
+    by_type = {}
+    for obj in system_objects:
+        by_type.setdefault(obj.type, []).append(obj)
+    _system_type_index[system] = (system_objects, by_type)
+    return by_type
+
+
+def invalidate_system_index(system):
+    """Drop the type grouping of a system so the next lookup regroups its objects."""
+    _system_type_index.pop(system, None)
+
+
+def add_system_object(systems, system, obj):
+    """Append an object to a system's object list, keeping the type index current."""
+    systems[system].append(obj)
+    invalidate_system_index(system)
+
+
+def remove_system_object(systems, system, obj):
+    """Remove an object from a system's object list, keeping the type index current."""
+    systems[system].remove(obj)
+    invalidate_system_index(system)
+
+
+def find_system_player(systems, system):
+    """Return the player object placed in a system, or None."""
+    players = get_system_objects_by_type(systems, system).get('player')
+    return players[0] if players else None
+
+
+def find_system_star(systems, system):
+    """Return the (first) star object in a system, or None."""
+    stars = get_system_objects_by_type(systems, system).get('star')
+    return stars[0] if stars else None
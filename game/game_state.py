@@ -4,8 +4,9 @@ Replaces global variables with a structured state management system
 """
 
 import pygame
-from typing import Dict, Set, Tuple, Optional, Any, List
+from typing import Dict, Set, Tuple, Optional, Any, List, Deque
 from dataclasses import dataclass
+from collections import deque
 
 
 @dataclass
@@ -86,7 +87,7 @@ class UIState:
     """Manages UI-specific state"""
     button_pressed: List[bool] = None
     toggle_btn_pressed: List[bool] = None
-    event_log: List[str] = None
+    event_log: Deque[str] = None
     
     def __post_init__(self):
         if self.button_pressed is None:
@@ -94,7 +95,7 @@ class UIState:
         if self.toggle_btn_pressed is None:
             self.toggle_btn_pressed = [False]
         if self.event_log is None:
-            self.event_log = []
+            self.event_log = deque(maxlen=25)
 
 
 class GameState:
@@ -120,7 +121,7 @@ class GameState:
         self.weapon_animation_manager = None
         
         # System and object management
-        self.system_object_states: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self.system_object_states: Dict[Tuple[int, int], List[Any]] = {}
         self.last_debug_system: Optional[Tuple[int, int]] = None
         
         # Initialize animation position
@@ -146,6 +147,27 @@ class GameState:
         if hex_grid:
             self.animation.ship_anim_x, self.animation.ship_anim_y = hex_grid.get_hex_center(q, r)
     
+    def record_system_objects(self, system: Tuple[int, int], objects: List[Any]):
+        """Record the generated objects of a system; see snapshot_system_objects"""
+        self.system_object_states[system] = objects
+
+    def snapshot_system_objects(self, system: Tuple[int, int]) -> List[Dict[str, Any]]:
+        """Return the current layout of a recorded system's objects as plain dicts.
+
+        Built on request rather than at generation time, since most generated
+        systems are never saved.
+        """
+        return [
+            {
+                'type': obj.type,
+                'q': obj.q,
+                'r': obj.r,
+                'system_q': obj.system_q,
+                'system_r': obj.system_r,
+                'props': obj.props
+            } for obj in self.system_object_states.get(system, ())
+        ]
+    
     def set_current_system(self, system: Tuple[int, int]):
         """Set current system and update related state"""
         self.current_system = system
@@ -267,9 +289,14 @@ class GameState:
     
     def add_event_log(self, message: str, max_lines: int = 25):
         """Add message to event log"""
-        self.ui.event_log.append(message)
-        if len(self.ui.event_log) > max_lines:
-            self.ui.event_log.pop(0)
+        self.add_event_logs((message,), max_lines)
+
+    def add_event_logs(self, messages, max_lines: int = 25):
+        """Add several messages to event log in one go"""
+        if self.ui.event_log.maxlen != max_lines:
+            self.ui.event_log = deque(self.ui.event_log, maxlen=max_lines)
+        # The deque drops the oldest messages itself once it is full
+        self.ui.event_log.extend(messages)
     
     def clear_event_log(self):
         """Clear event log"""
@@ -123,13 +123,13 @@ class CombatManager:
             shield_integrity = target_enemy.shield_system.current_integrity
             initial_shields = int((shield_power * target_enemy.shield_system.absorption_per_level) * (shield_integrity / 100.0))
             print(f"[COMBAT] Shield system found: power={shield_power}, integrity={shield_integrity}, effective_shields={initial_shields}")
-        elif hasattr(target_enemy, 'shields'):
+        elif getattr(target_enemy, 'shields', None) is not None:
             initial_shields = target_enemy.shields
             print(f"[COMBAT] Using shields property: {initial_shields}")
 
         if hasattr(target_enemy, 'hull_strength'):
             initial_hull = target_enemy.hull_strength
-        elif hasattr(target_enemy, 'health'):
+        elif getattr(target_enemy, 'health', None) is not None:
             initial_hull = target_enemy.health
 
         # Use the proper apply_damage method from BaseShip if available
@@ -142,12 +142,12 @@ class CombatManager:
                 self.comms_manager.on_enemy_damaged(target_enemy)
         elif damage > 0:
             # Fallback for objects without apply_damage (legacy MapObjects)
-            shield_damage_legacy = min(damage, target_enemy.shields) if hasattr(target_enemy, 'shields') else 0
+            shield_damage_legacy = min(damage, target_enemy.shields) if getattr(target_enemy, 'shields', None) is not None else 0
             hull_damage_legacy = damage - shield_damage_legacy
 
-            if hasattr(target_enemy, 'shields'):
+            if getattr(target_enemy, 'shields', None) is not None:
                 target_enemy.shields -= shield_damage_legacy
-            if hasattr(target_enemy, 'health'):
+            if getattr(target_enemy, 'health', None) is not None:
                 target_enemy.health -= hull_damage_legacy
                 target_enemy.health = max(0, target_enemy.health)
 
@@ -159,12 +159,12 @@ class CombatManager:
             shield_power = target_enemy.shield_system.current_power_level
             shield_integrity = target_enemy.shield_system.current_integrity
             final_shields = int((shield_power * target_enemy.shield_system.absorption_per_level) * (shield_integrity / 100.0))
-        elif hasattr(target_enemy, 'shields'):
+        elif getattr(target_enemy, 'shields', None) is not None:
             final_shields = target_enemy.shields
 
         if hasattr(target_enemy, 'hull_strength'):
             final_hull = target_enemy.hull_strength
-        elif hasattr(target_enemy, 'health'):
+        elif getattr(target_enemy, 'health', None) is not None:
             final_hull = target_enemy.health
 
         # Calculate actual damage dealt for reporting
@@ -184,7 +184,7 @@ class CombatManager:
         updated_result['target_shields'] = final_shields
         updated_result['target_health'] = final_hull
         updated_result['target_max_health'] = target_enemy.max_hull_strength if hasattr(target_enemy, 'max_hull_strength') else 100
-        updated_result['target_max_shields'] = target_enemy.max_shields if hasattr(target_enemy, 'max_shields') else 100
+        updated_result['target_max_shields'] = target_enemy.max_shields if getattr(target_enemy, 'max_shields', None) is not None else 100
         updated_result['target_destroyed'] = final_hull <= 0
 
         return updated_result
@@ -195,7 +195,7 @@ class CombatManager:
 
         if enemy_id not in self.enemy_ships:
             # Create new dynamic EnemyShip instance with faction-based personality
-            position = (enemy_obj.system_q, enemy_obj.system_r) if hasattr(enemy_obj, 'system_q') else (0, 0)
+            position = (enemy_obj.system_q, enemy_obj.system_r) if enemy_obj.system_q is not None else (0, 0)
 
             # Get faction from enemy object (defaults to klingon for backwards compatibility)
             faction = getattr(enemy_obj, 'faction', None) or 'klingon'
@@ -295,7 +295,7 @@ class CombatManager:
         player_system_pos = None
         if system_objects:
             for obj in system_objects:
-                if obj.type == 'player' and hasattr(obj, 'system_q') and hasattr(obj, 'system_r'):
+                if obj.type == 'player' and obj.system_q is not None and obj.system_r is not None:
                     player_system_pos = (obj.system_q, obj.system_r)
                     break
 
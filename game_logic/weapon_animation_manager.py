@@ -385,9 +385,9 @@ class WeaponAnimationManager:
     def _get_player_real_time_position(self, player_obj, hex_grid):
         """Get player's current pixel position, accounting for movement animation."""
         # Check for animated position first
-        if hasattr(player_obj, 'anim_px') and hasattr(player_obj, 'anim_py'):
+        if player_obj.anim_px is not None and player_obj.anim_py is not None:
             return (player_obj.anim_px, player_obj.anim_py)
-        elif hasattr(player_obj, 'system_q') and hasattr(player_obj, 'system_r'):
+        elif player_obj.system_q is not None and player_obj.system_r is not None:
             try:
                 return hex_grid.get_hex_center(player_obj.system_q, player_obj.system_r)
             except:
@@ -397,9 +397,9 @@ class WeaponAnimationManager:
     def _get_enemy_real_time_position(self, enemy, hex_grid):
         """Get enemy's current pixel position, accounting for movement animation."""
         # Use the same logic as get_enemy_current_position in wireframe
-        if hasattr(enemy, 'anim_px') and hasattr(enemy, 'anim_py'):
+        if enemy.anim_px is not None and enemy.anim_py is not None:
             return (enemy.anim_px, enemy.anim_py)
-        elif hasattr(enemy, 'system_q') and hasattr(enemy, 'system_r'):
+        elif enemy.system_q is not None and enemy.system_r is not None:
             try:
                 return hex_grid.get_hex_center(enemy.system_q, enemy.system_r)
             except:
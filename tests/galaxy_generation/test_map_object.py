@@ -0,0 +1,49 @@
+from galaxy_generation.map_object import (
+    MapObject, add_system_object, remove_system_object,
+    find_system_player, find_system_star, get_system_objects_by_type
+)
+
+
+def _make_system():
+    star = MapObject('star', 0, 0)
+    enemy = MapObject('enemy', 0, 0, faction='klingon')
+    anomaly = MapObject('anomaly', 0, 0)
+    return {(0, 0): [star, enemy, anomaly]}, star, enemy, anomaly
+
+
+def test_objects_grouped_by_type():
+    systems, star, enemy, anomaly = _make_system()
+    by_type = get_system_objects_by_type(systems, (0, 0))
+    assert by_type == {'star': [star], 'enemy': [enemy], 'anomaly': [anomaly]}
+    assert find_system_star(systems, (0, 0)) is star
+    assert find_system_player(systems, (0, 0)) is None
+    # Unknown systems have no objects
+    assert get_system_objects_by_type(systems, (9, 9)) == {}
+    assert find_system_star(systems, (9, 9)) is None
+
+
+def test_index_follows_add_and_remove():
+    systems, star, enemy, anomaly = _make_system()
+    get_system_objects_by_type(systems, (0, 0))
+    # Remove and add keep the list length the same; the index must still update
+    player = MapObject('player', 0, 0)
+    remove_system_object(systems, (0, 0), enemy)
+    add_system_object(systems, (0, 0), player)
+    assert find_system_player(systems, (0, 0)) is player
+    assert 'enemy' not in get_system_objects_by_type(systems, (0, 0))
+
+
+def test_index_follows_replaced_list():
+    systems, star, enemy, anomaly = _make_system()
+    get_system_objects_by_type(systems, (0, 0))
+    new_star = MapObject('star', 0, 0)
+    systems[(0, 0)] = [new_star]
+    assert find_system_star(systems, (0, 0)) is new_star
+    assert get_system_objects_by_type(systems, (0, 0)) == {'star': [new_star]}
+
+
+def test_ui_state_defaults_to_none_without_instance_dict():
+    obj = MapObject('enemy', 0, 0)
+    assert not hasattr(obj, '__dict__')
+    assert obj.star_image is None and obj.current_rotation is None
+    assert obj.health is None and obj.anim_px is None
@@ -0,0 +1,41 @@
+import math
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from ui.hex_map import HexGrid
+
+
+def _formula_center(grid, col, row):
+    """Flat-topped hex center, with odd columns shifted up by half a hex."""
+    x = grid.offset_x + grid.radius + col * 1.5 * grid.radius
+    y = grid.offset_y + grid.radius * math.sqrt(3) / 2 + row * grid.radius * math.sqrt(3)
+    if col % 2 == 1:
+        y -= grid.radius * math.sqrt(3) / 2
+    return x, y
+
+
+def test_hex_center_table_matches_formula_on_grid():
+    grid = HexGrid(20, 20, 100, 50, 600)
+    for col in range(grid.cols):
+        for row in range(grid.rows):
+            assert grid.get_hex_center(col, row) == _formula_center(grid, col, row)
+
+
+def test_hex_center_off_grid_falls_back_to_formula():
+    grid = HexGrid(20, 20, 100, 50, 600)
+    for col, row in [(-1, 0), (0, -1), (20, 0), (0, 20), (25, 31)]:
+        assert grid.get_hex_center(col, row) == _formula_center(grid, col, row)
+
+
+def test_hex_center_round_trips_through_pixel_to_hex():
+    grid = HexGrid(20, 20, 100, 50, 600)
+    for col, row in [(0, 0), (5, 7), (19, 19)]:
+        assert grid.pixel_to_hex(*grid.get_hex_center(col, row)) == (col, row)
+
+
+def test_pixel_to_hex_lookup_matches_computation():
+    grid = HexGrid(20, 20, 100, 50, 600)
+    for x in range(grid.map_x, grid.map_x + grid.map_size, 7):
+        for y in range(grid.map_y, grid.map_y + grid.map_size, 7):
+            assert grid.pixel_to_hex(x, y) == grid._compute_pixel_to_hex(x, y)
@@ -0,0 +1,50 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from ui import text_utils
+from ui.text_utils import render_text, wrap_text
+
+
+def setup_module(module):
+    pygame.font.init()
+
+
+def test_render_text_reuses_surface():
+    font = pygame.font.Font(None, 18)
+    first = render_text(font, "SHIELD STATUS", (255, 255, 255))
+    assert render_text(font, "SHIELD STATUS", [255, 255, 255]) is first
+    assert render_text(font, "SHIELD STATUS", (255, 0, 0)) is not first
+
+
+def test_render_text_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(text_utils, '_TEXT_SURFACE_CACHE_LIMIT', 3)
+    text_utils._text_surface_cache.clear()
+    font = pygame.font.Font(None, 18)
+    label = render_text(font, "label", (255, 255, 255))
+    render_text(font, "a", (255, 255, 255))
+    render_text(font, "b", (255, 255, 255))
+    # Drawing the label again keeps it ahead of the older entries
+    assert render_text(font, "label", (255, 255, 255)) is label
+    render_text(font, "c", (255, 255, 255))
+    assert len(text_utils._text_surface_cache) == 3
+    assert (font, "a", (255, 255, 255)) not in text_utils._text_surface_cache
+    assert render_text(font, "label", (255, 255, 255)) is label
+
+
+def test_wrap_text_keeps_short_text_on_one_line():
+    font = pygame.font.Font(None, 18)
+    assert wrap_text("Shields  up", 500, font) == ["Shields up"]
+    assert wrap_text("", 500, font) == []
+
+
+def test_wrap_text_splits_long_text():
+    font = pygame.font.Font(None, 18)
+    text = "Klingon battle cruiser decloaking off the port bow"
+    max_width = font.size("Klingon battle cruiser")[0]
+    lines = wrap_text(text, max_width, font)
+    assert len(lines) > 1
+    assert " ".join(lines) == text
+    assert all(font.size(line)[0] <= max_width for line in lines)
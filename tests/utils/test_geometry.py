@@ -0,0 +1,25 @@
+from utils.geometry import hex_neighbors
+
+
+def _expected_neighbors(q, r):
+    """Neighbor layout for flat-topped hexes, written out per column parity."""
+    if q % 2 == 0:
+        return [(q-1, r-1), (q-1, r), (q, r-1), (q, r+1), (q+1, r-1), (q+1, r)]
+    return [(q-1, r), (q-1, r+1), (q, r-1), (q, r+1), (q+1, r), (q+1, r+1)]
+
+
+def test_hex_neighbors_even_and_odd_columns():
+    assert hex_neighbors(2, 5) == [(1, 4), (1, 5), (2, 4), (2, 6), (3, 4), (3, 5)]
+    assert hex_neighbors(3, 5) == [(2, 5), (2, 6), (3, 4), (3, 6), (4, 5), (4, 6)]
+
+
+def test_hex_neighbors_match_layout_across_grid():
+    for q in range(-2, 30):
+        for r in range(-2, 30):
+            assert hex_neighbors(q, r) == _expected_neighbors(q, r)
+
+
+def test_hex_neighbors_returns_new_list():
+    first = hex_neighbors(4, 4)
+    first.append((0, 0))
+    assert len(hex_neighbors(4, 4)) == 6
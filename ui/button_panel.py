@@ -1,5 +1,7 @@
 import pygame
 
+from ui.text_utils import render_text
+
 BUTTON_WIDTH = 200
 BUTTON_HEIGHT = 48
 BUTTON_MARGIN = 16
@@ -8,6 +10,9 @@ PANEL_Y = 40
 
 BUTTON_LABELS = ["Move", "Fire", "Torpedo", "Scan", "Repairs"]
 
+# Toggle button font, loaded on first draw (SysFont is too slow to call every frame)
+_toggle_font = None
+
 # Draws all control panel buttons and the map mode toggle button at the bottom
 # Returns: (button_rects, toggle_btn_rect)
 def draw_button_panel(
@@ -30,6 +35,7 @@ def draw_button_panel(
     Returns: (button_rects, toggle_btn_rect)
     """
     button_rects = []
+    label_blits = []
     # Regular buttons with proper spacing from Control Panel label
     # Using 40px offset to fit 5 buttons in the control panel area
     for i, label in enumerate(BUTTON_LABELS):
@@ -38,10 +44,12 @@ def draw_button_panel(
         btn_rect = pygame.Rect(bx, by, button_w, button_h)
         button_rects.append(btn_rect)
         pygame.draw.rect(surface, color, btn_rect, border_radius=6)
-        btn_label = font.render(label, True, color_text)
+        btn_label = render_text(font, label, color_text)
         # Center text vertically in smaller button
         text_y = by + (button_h - btn_label.get_height()) // 2
-        surface.blit(btn_label, (bx + 18, text_y))
+        label_blits.append((btn_label, (bx + 18, text_y)))
+    # Buttons don't overlap, so all labels can go out in one call
+    surface.blits(label_blits, doreturn=False)
     # Toggle map mode button - place it to the right of the main buttons
     toggle_btn_x = event_log_width + 40 + button_w + 20  # Next to the regular buttons
     # Use the passed-in y position
@@ -51,8 +59,10 @@ def draw_button_panel(
     toggle_btn_rect = pygame.Rect(toggle_btn_x, toggle_btn_y, toggle_btn_w, toggle_btn_h)
     pygame.draw.rect(surface, color, toggle_btn_rect, border_radius=8)
     # Use a smaller sans-serif font for the toggle button
-    small_font = pygame.font.SysFont('arial', 14)
-    btn_label = small_font.render(label, True, color_text)
+    global _toggle_font
+    if _toggle_font is None:
+        _toggle_font = pygame.font.SysFont('arial', 14)
+    btn_label = render_text(_toggle_font, label, color_text)
     # Center the label in the button
     label_rect = btn_label.get_rect(center=toggle_btn_rect.center)
     surface.blit(btn_label, label_rect)
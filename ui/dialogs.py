@@ -56,8 +56,26 @@ def show_game_over_screen(screen, ship_name):
         clock.tick(60)
 
 
+# Events the orbit dialog redraws on, which the main loop may have blocked
+ORBIT_DIALOG_EVENTS = (pygame.MOUSEMOTION, pygame.VIDEOEXPOSE)
+
+
 def show_orbit_dialog(screen, font):
     """Show a popup dialog asking if player wants to orbit the planet."""
+    # Hover and expose events drive the redraws here, so let them through
+    # while the dialog is open and restore the caller's filter afterwards
+    blocked = [event_type for event_type in ORBIT_DIALOG_EVENTS if pygame.event.get_blocked(event_type)]
+    if blocked:
+        pygame.event.set_allowed(blocked)
+    try:
+        return _run_orbit_dialog(screen, font)
+    finally:
+        if blocked:
+            pygame.event.set_blocked(blocked)
+
+
+def _run_orbit_dialog(screen, font):
+    """Run the orbit dialog loop and return True for Yes, False for No."""
     # Dialog dimensions
     dialog_width = 400
     dialog_height = 150
@@ -78,9 +96,15 @@ def show_orbit_dialog(screen, font):
     yes_button_x = dialog_x + 80
     no_button_x = dialog_x + 240
     button_y = dialog_y + 90
+    # Only the dialog changes while it is open, so only its rect is presented
+    dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
+    full_present = False
     
-    clock = pygame.time.Clock()
-    
+    # The dialog only changes when the hover state does, so it is redrawn on
+    # demand and the loop sleeps in event.wait() instead of ticking at 60 FPS
+    drawn_hover = None
+    event = None
+
     while True:
         mouse_pos = pygame.mouse.get_pos()
         
@@ -90,7 +114,7 @@ def show_orbit_dialog(screen, font):
         no_hover = (no_button_x <= mouse_pos[0] <= no_button_x + button_width and
                    button_y <= mouse_pos[1] <= button_y + button_height)
         
-        for event in pygame.event.get():
+        if event is not None:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -105,38 +129,48 @@ def show_orbit_dialog(screen, font):
                     return True
                 elif event.key == pygame.K_n or event.key == pygame.K_ESCAPE:
                     return False
+            elif event.type == pygame.VIDEOEXPOSE:
+                drawn_hover = None  # Window contents were lost, repaint
+                full_present = True
         
-        # Draw dialog background
-        pygame.draw.rect(screen, dialog_bg, (dialog_x, dialog_y, dialog_width, dialog_height))
-        pygame.draw.rect(screen, dialog_border, (dialog_x, dialog_y, dialog_width, dialog_height), 3)
+        if (yes_hover, no_hover) != drawn_hover:
+            drawn_hover = (yes_hover, no_hover)
+            # Draw dialog background
+            pygame.draw.rect(screen, dialog_bg, (dialog_x, dialog_y, dialog_width, dialog_height))
+            pygame.draw.rect(screen, dialog_border, (dialog_x, dialog_y, dialog_width, dialog_height), 3)
         
-        # Draw text
-        title_text = font.render("Planet Detected", True, text_color)
-        title_rect = title_text.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 30))
-        screen.blit(title_text, title_rect)
+            # Draw text
+            title_text = font.render("Planet Detected", True, text_color)
+            title_rect = title_text.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 30))
+            screen.blit(title_text, title_rect)
         
-        query_text = font.render("Enter standard orbit?", True, text_color)
-        query_rect = query_text.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 60))
-        screen.blit(query_text, query_rect)
+            query_text = font.render("Enter standard orbit?", True, text_color)
+            query_rect = query_text.get_rect(center=(dialog_x + dialog_width // 2, dialog_y + 60))
+            screen.blit(query_text, query_rect)
         
-        # Draw buttons
-        yes_color = button_hover if yes_hover else button_bg
-        no_color = button_hover if no_hover else button_bg
+            # Draw buttons
+            yes_color = button_hover if yes_hover else button_bg
+            no_color = button_hover if no_hover else button_bg
         
-        pygame.draw.rect(screen, yes_color, (yes_button_x, button_y, button_width, button_height))
-        pygame.draw.rect(screen, dialog_border, (yes_button_x, button_y, button_width, button_height), 2)
+            pygame.draw.rect(screen, yes_color, (yes_button_x, button_y, button_width, button_height))
+            pygame.draw.rect(screen, dialog_border, (yes_button_x, button_y, button_width, button_height), 2)
         
-        pygame.draw.rect(screen, no_color, (no_button_x, button_y, button_width, button_height))
-        pygame.draw.rect(screen, dialog_border, (no_button_x, button_y, button_width, button_height), 2)
+            pygame.draw.rect(screen, no_color, (no_button_x, button_y, button_width, button_height))
+            pygame.draw.rect(screen, dialog_border, (no_button_x, button_y, button_width, button_height), 2)
         
-        # Draw button text
-        yes_text = font.render("Yes (Y)", True, text_color)
-        yes_rect = yes_text.get_rect(center=(yes_button_x + button_width // 2, button_y + button_height // 2))
-        screen.blit(yes_text, yes_rect)
+            # Draw button text
+            yes_text = font.render("Yes (Y)", True, text_color)
+            yes_rect = yes_text.get_rect(center=(yes_button_x + button_width // 2, button_y + button_height // 2))
+            screen.blit(yes_text, yes_rect)
         
-        no_text = font.render("No (N)", True, text_color)
-        no_rect = no_text.get_rect(center=(no_button_x + button_width // 2, button_y + button_height // 2))
-        screen.blit(no_text, no_rect)
+            no_text = font.render("No (N)", True, text_color)
+            no_rect = no_text.get_rect(center=(no_button_x + button_width // 2, button_y + button_height // 2))
+            screen.blit(no_text, no_rect)
         
-        pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+            if full_present:
+                pygame.display.flip()
+                full_present = False
+            else:
+                pygame.display.update(dialog_rect)
+
+        event = pygame.event.wait(100)
\ No newline at end of file
@@ -24,29 +24,29 @@ class EnemyPopupManager:
         popup_y = 40 + 50 + (len(self.enemy_popups) * (popup_height + 10))  # Stack vertically
         
         # Initialize enemy stats if not present
-        if not hasattr(enemy_obj, 'health'):
+        if enemy_obj.health is None:
             enemy_obj.health = 100
-        if not hasattr(enemy_obj, 'max_health'):
+        if enemy_obj.max_health is None:
             enemy_obj.max_health = 100
-        if not hasattr(enemy_obj, 'energy'):
+        if enemy_obj.energy is None:
             enemy_obj.energy = 1000
-        if not hasattr(enemy_obj, 'max_energy'):
+        if enemy_obj.max_energy is None:
             enemy_obj.max_energy = 1000
-        if not hasattr(enemy_obj, 'shields'):
+        if enemy_obj.shields is None:
             enemy_obj.shields = 100  # Start with full shields
-        if not hasattr(enemy_obj, 'max_shields'):
+        if enemy_obj.max_shields is None:
             enemy_obj.max_shields = 100
-        if not hasattr(enemy_obj, 'weapons_status'):
+        if enemy_obj.weapons_status is None:
             enemy_obj.weapons_status = 'Online'
-        if not hasattr(enemy_obj, 'engine_status'):
+        if enemy_obj.engine_status is None:
             enemy_obj.engine_status = 'Online'
-        if not hasattr(enemy_obj, 'distance'):
+        if enemy_obj.distance is None:
             enemy_obj.distance = 0.0
-        if not hasattr(enemy_obj, 'bearing'):
+        if enemy_obj.bearing is None:
             enemy_obj.bearing = 0.0
         
         # Initialize power allocation system (0-9 scale) at full power
-        if not hasattr(enemy_obj, 'power_allocation'):
+        if enemy_obj.power_allocation is None:
             enemy_obj.power_allocation = {
                 'phasers': 9,      # Full power
                 'shields': 9,      
@@ -56,7 +56,7 @@ class EnemyPopupManager:
             }
         
         # Initialize system integrity (0-100 scale) at full integrity
-        if not hasattr(enemy_obj, 'system_integrity'):
+        if enemy_obj.system_integrity is None:
             enemy_obj.system_integrity = {
                 'hull': 100,
                 'shields': 100,
@@ -104,7 +104,7 @@ class EnemyPopupManager:
         popup_surface.blit(name_text, (10, y_offset))
         y_offset += 30
         
-        class_text = font.render(f"Class: {getattr(enemy, 'ship_class', 'Unknown')}", True, (200, 200, 200))
+        class_text = font.render(f"Class: {enemy.ship_class or 'Unknown'}", True, (200, 200, 200))
         popup_surface.blit(class_text, (10, y_offset))
         y_offset += 25
         
@@ -191,7 +191,7 @@ class EnemyPopupManager:
         for enemy_id, popup_info in self.enemy_popups.items():
             enemy = popup_info['enemy_obj']
             # Check if enemy is destroyed
-            if not hasattr(enemy, 'health') or enemy.health <= 0:
+            if enemy.health is None or enemy.health <= 0:
                 destroyed_enemies.append(enemy_id)
             # Check if enemy is still in current system
             elif enemy not in systems.get(current_system, []):
@@ -220,7 +220,7 @@ class EnemyPopupManager:
     def perform_scan(self, enemy_obj, enemy_id, player_obj, event_log_callback):
         """Perform a detailed scan of an enemy and add results to scan panel."""
         # Calculate distance from player
-        if player_obj and hasattr(player_obj, 'system_q') and hasattr(player_obj, 'system_r'):
+        if player_obj and player_obj.system_q is not None and player_obj.system_r is not None:
             dx = enemy_obj.system_q - player_obj.system_q
             dy = enemy_obj.system_r - player_obj.system_r
             distance = math.sqrt(dx * dx + dy * dy)
@@ -35,21 +35,21 @@ def create_enemy_popup(enemy_id, enemy_obj, game_state, map_size, right_event_lo
     popup_y = status_height + 50 + (len(game_state.scan.enemy_popups) * (popup_height + 10))
 
     # Initialize enemy stats if not present
-    if not hasattr(enemy_obj, 'health'):
+    if enemy_obj.health is None:
         enemy_obj.health = 100
-    if not hasattr(enemy_obj, 'max_health'):
+    if enemy_obj.max_health is None:
         enemy_obj.max_health = 100
-    if not hasattr(enemy_obj, 'energy'):
+    if enemy_obj.energy is None:
         enemy_obj.energy = 1000
-    if not hasattr(enemy_obj, 'max_energy'):
+    if enemy_obj.max_energy is None:
         enemy_obj.max_energy = 1000
-    if not hasattr(enemy_obj, 'shields'):
+    if enemy_obj.shields is None:
         enemy_obj.shields = ENEMY_SHIELD_CAPACITY
-    if not hasattr(enemy_obj, 'max_shields'):
+    if enemy_obj.max_shields is None:
         enemy_obj.max_shields = ENEMY_SHIELD_CAPACITY
-    if not hasattr(enemy_obj, 'ship_name'):
+    if enemy_obj.ship_name is None:
         enemy_obj.ship_name = f"Enemy Vessel {enemy_id}"
-    if not hasattr(enemy_obj, 'ship_class'):
+    if enemy_obj.ship_class is None:
         ship_classes = ["Klingon Bird of Prey", "Romulan Warbird", "Gorn Destroyer", "Tholian Web Spinner"]
         enemy_obj.ship_class = random.choice(ship_classes)
 
@@ -187,7 +187,7 @@ def update_enemy_popups(game_state, systems, enemy_scan_panel, add_event_log):
     for enemy_id, popup_info in game_state.scan.enemy_popups.items():
         enemy = popup_info['enemy_obj']
         # Check if enemy is destroyed
-        if not hasattr(enemy, 'health') or enemy.health <= 0:
+        if enemy.health is None or enemy.health <= 0:
             destroyed_enemies.append(enemy_id)
         # Check if enemy is still in current system
         elif enemy not in systems.get(game_state.current_system, []):
@@ -7,6 +7,8 @@ Matches the player ship status display format for consistency
 import pygame
 import math
 
+from ui.text_utils import render_text
+
 class EnemyScanPanel:
     """
     LCARS-style enemy scan panel showing (matching player ship display):
@@ -98,17 +100,17 @@ class EnemyScanPanel:
         pygame.draw.rect(screen, self.border_color, self.rect, 2)
 
         # Title
-        title_text = self.large_font.render("ENEMY TACTICAL SCAN", True, self.border_color)
+        title_text = render_text(self.large_font, "ENEMY TACTICAL SCAN", self.border_color)
         screen.blit(title_text, (self.rect.x + 10, self.rect.y + 5))
 
         current_y = self.rect.y + 28
 
         if not self.scanned_enemies:
             # No scan data
-            no_data_text = self.font.render("No enemies scanned", True, self.text_color)
+            no_data_text = render_text(self.font, "No enemies scanned", self.text_color)
             screen.blit(no_data_text, (self.rect.x + 10, current_y))
 
-            instruction_text = self.small_font.render("Right-click enemies to scan", True, (150, 150, 150))
+            instruction_text = render_text(self.small_font, "Right-click enemies to scan", (150, 150, 150))
             screen.blit(instruction_text, (self.rect.x + 10, current_y + 25))
         else:
             # Calculate available height per enemy
@@ -144,7 +146,7 @@ class EnemyScanPanel:
         else:
             name_color = self.enemy_color
 
-        name_surface = self.medium_font.render(name_text, True, name_color)
+        name_surface = render_text(self.medium_font, name_text, name_color)
         screen.blit(name_surface, (self.rect.x + 8, y))
         y += 16
 
@@ -174,7 +176,7 @@ class EnemyScanPanel:
 
     def draw_energy_bar(self, screen, y, label, current, maximum):
         """Draw energy status bar."""
-        label_surface = self.small_font.render(label, True, self.border_color)
+        label_surface = render_text(self.small_font, label, self.border_color)
         screen.blit(label_surface, (self.rect.x + 8, y))
 
         # Energy bar
@@ -205,14 +207,14 @@ class EnemyScanPanel:
 
         # Value text
         value_text = f"{int(current)}/{int(maximum)}"
-        value_surface = self.small_font.render(value_text, True, self.text_color)
+        value_surface = render_text(self.small_font, value_text, self.text_color)
         screen.blit(value_surface, (bar_x + bar_width + 5, y + 10))
 
         return y + 26
 
     def draw_power_allocation(self, screen, y, power_allocation):
         """Draw power allocation meters (read-only, compact)."""
-        label_surface = self.small_font.render("POWER ALLOCATION", True, self.border_color)
+        label_surface = render_text(self.small_font, "POWER ALLOCATION", self.border_color)
         screen.blit(label_surface, (self.rect.x + 8, y))
         y += 12
 
@@ -226,7 +228,7 @@ class EnemyScanPanel:
 
             # System name (abbreviated)
             abbrev = system[:3].upper()
-            system_text = self.small_font.render(f"{abbrev}:", True, self.text_color)
+            system_text = render_text(self.small_font, f"{abbrev}:", self.text_color)
             screen.blit(system_text, (self.rect.x + 8, y))
 
             # Power level bars (1-9)
@@ -249,7 +251,7 @@ class EnemyScanPanel:
                 pygame.draw.rect(screen, self.border_color, box_rect, 1)
 
             # Power level number
-            level_text = self.small_font.render(str(power_level), True, self.text_color)
+            level_text = render_text(self.small_font, str(power_level), self.text_color)
             screen.blit(level_text, (bar_x + 9 * bar_spacing + 5, y))
 
             y += 13
@@ -258,7 +260,7 @@ class EnemyScanPanel:
 
     def draw_system_integrity(self, screen, y, enemy_data):
         """Draw system integrity status (compact)."""
-        label_surface = self.small_font.render("SYSTEM INTEGRITY", True, self.border_color)
+        label_surface = render_text(self.small_font, "SYSTEM INTEGRITY", self.border_color)
         screen.blit(label_surface, (self.rect.x + 8, y))
         y += 12
 
@@ -278,7 +280,7 @@ class EnemyScanPanel:
 
         for abbrev, current, maximum in systems:
             # System abbreviation
-            sys_text = self.small_font.render(f"{abbrev}:", True, self.text_color)
+            sys_text = render_text(self.small_font, f"{abbrev}:", self.text_color)
             screen.blit(sys_text, (self.rect.x + 8, y))
 
             # Integrity bar
@@ -325,10 +327,10 @@ class EnemyScanPanel:
                 status_color = (80, 80, 80)
 
             value_text = f"{int(current)}"
-            value_surface = self.small_font.render(value_text, True, self.text_color)
+            value_surface = render_text(self.small_font, value_text, self.text_color)
             screen.blit(value_surface, (bar_x + bar_width + 3, y))
 
-            status_surface = self.small_font.render(status, True, status_color)
+            status_surface = render_text(self.small_font, status, status_color)
             screen.blit(status_surface, (self.rect.x + self.rect.width - 30, y))
 
             y += 11
@@ -337,7 +339,7 @@ class EnemyScanPanel:
 
     def draw_shield_status(self, screen, y, enemy_data):
         """Draw shield status."""
-        label_surface = self.small_font.render("SHIELD STATUS", True, self.border_color)
+        label_surface = render_text(self.small_font, "SHIELD STATUS", self.border_color)
         screen.blit(label_surface, (self.rect.x + 8, y))
         y += 12
 
@@ -348,14 +350,14 @@ class EnemyScanPanel:
 
         # Shield power and integrity
         power_text = f"Power: {shield_power}/9  Integrity: {shield_integrity:.0f}%"
-        power_surface = self.small_font.render(power_text, True, self.text_color)
+        power_surface = render_text(self.small_font, power_text, self.text_color)
         screen.blit(power_surface, (self.rect.x + 8, y))
         y += 11
 
         # Absorption rate (based on power level)
         absorption = shield_power * 10  # 10 damage absorbed per power level
         absorb_text = f"Absorption: {absorption} per hit"
-        absorb_surface = self.small_font.render(absorb_text, True, self.text_color)
+        absorb_surface = render_text(self.small_font, absorb_text, self.text_color)
         screen.blit(absorb_surface, (self.rect.x + 8, y))
         y += 11
 
@@ -370,14 +372,14 @@ class EnemyScanPanel:
             status_text = "SHIELDS UP"
             status_color = self.good_color
 
-        status_surface = self.small_font.render(status_text, True, status_color)
+        status_surface = render_text(self.small_font, status_text, status_color)
         screen.blit(status_surface, (self.rect.x + 8, y))
 
         return y + 14
 
     def draw_weapon_status(self, screen, y, enemy_data):
         """Draw weapon systems status."""
-        label_surface = self.small_font.render("WEAPON STATUS", True, self.border_color)
+        label_surface = render_text(self.small_font, "WEAPON STATUS", self.border_color)
         screen.blit(label_surface, (self.rect.x + 8, y))
         y += 12
 
@@ -399,7 +401,7 @@ class EnemyScanPanel:
             phaser_text = f"PHASERS: {weapons_status}"
             phaser_color = self.warning_color
 
-        phaser_surface = self.small_font.render(phaser_text, True, phaser_color)
+        phaser_surface = render_text(self.small_font, phaser_text, phaser_color)
         screen.blit(phaser_surface, (self.rect.x + 8, y))
         y += 11
 
@@ -417,7 +419,7 @@ class EnemyScanPanel:
             torpedo_text = f"TORPEDOES: {torpedo_count}/{max_torpedoes}"
             torpedo_color = self.good_color
 
-        torpedo_surface = self.small_font.render(torpedo_text, True, torpedo_color)
+        torpedo_surface = render_text(self.small_font, torpedo_text, torpedo_color)
         screen.blit(torpedo_surface, (self.rect.x + 8, y))
         y += 11
 
@@ -439,7 +441,7 @@ class EnemyScanPanel:
             engine_text = f"ENGINES: ONLINE (PWR {engine_power})"
             engine_color = self.good_color
 
-        engine_surface = self.small_font.render(engine_text, True, engine_color)
+        engine_surface = render_text(self.small_font, engine_text, engine_color)
         screen.blit(engine_surface, (self.rect.x + 8, y))
 
         return y + 14
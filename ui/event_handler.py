@@ -4,15 +4,14 @@ Event handling for the Star Trek Tactical Game.
 This module handles all user input events including button clicks,
 mouse clicks for navigation and targeting, and keyboard input.
 """
-import pygame
 import math
 import time
-import random
 import logging
 
 from debug_logger import log_debug
 from data import constants
-from galaxy_generation.map_object import MapObject
+from galaxy_generation.map_object import (MapObject, add_system_object, find_system_player,
+                                           find_system_star, get_system_objects_by_type)
 from galaxy_generation.object_placement import generate_system_objects
 from ui.hex_utils import get_star_hexes, get_planet_hexes
 from ui.dialogs import show_orbit_dialog
@@ -33,6 +32,8 @@ class EventContext:
         self.hex_grid = None
         self.screen = None
         self.font = None
+        # pygame.time.get_ticks() taken once at the start of the frame
+        self.current_time = 0
 
         # UI elements
         self.button_rects = None
@@ -86,6 +87,8 @@ class EventContext:
         self.get_enemy_id = None
         self.get_enemy_current_position = None
         self.is_hex_blocked = None
+        self.get_system_planet_orbits = None
+        self.place_system_objects = None
 
 
 class EventResult:
@@ -202,8 +205,7 @@ def _fire_torpedo_at_hex(ctx: EventContext, target_q: int, target_r: int) -> boo
     sound_manager = ctx.sound_manager
     add_event_log = ctx.add_event_log
 
-    player_obj = next((obj for obj in ctx.systems.get(ctx.current_system, [])
-                      if obj.type == 'player'), None)
+    player_obj = find_system_player(ctx.systems, ctx.current_system)
 
     if player_obj is None:
         add_event_log("Cannot determine player position")
@@ -310,16 +312,15 @@ def _handle_fire_button(ctx: EventContext) -> bool:
                     add_event_log("Cannot lock phasers - target is cloaked! Use torpedoes instead.")
                     return True
 
-            player_obj = next((obj for obj in ctx.systems.get(ctx.current_system, [])
-                              if obj.type == 'player'), None)
+            player_obj = find_system_player(ctx.systems, ctx.current_system)
 
             if player_obj is None:
                 # Create player object if missing
                 player_obj = _ensure_player_object(ctx)
 
             if (player_obj is not None and
-                hasattr(player_obj, 'system_q') and
-                hasattr(game_state.combat.selected_enemy, 'system_q')):
+                player_obj.system_q is not None and
+                game_state.combat.selected_enemy.system_q is not None):
 
                 dx = game_state.combat.selected_enemy.system_q - player_obj.system_q
                 dy = game_state.combat.selected_enemy.system_r - player_obj.system_r
@@ -351,28 +352,13 @@ def _ensure_player_object(ctx: EventContext):
     """Ensure player object exists in current system, creating one if needed."""
     current_system = ctx.current_system
     systems = ctx.systems
-    hex_grid = ctx.hex_grid
 
-    occupied = set((getattr(obj, 'system_q', None), getattr(obj, 'system_r', None))
-                   for obj in systems[current_system]
-                   if hasattr(obj, 'system_q') and hasattr(obj, 'system_r'))
-
-    max_attempts = 100
-    for _ in range(max_attempts):
-        rand_q = random.randint(0, hex_grid.cols - 1)
-        rand_r = random.randint(0, hex_grid.rows - 1)
-        if (rand_q, rand_r) not in occupied:
-            player_obj = MapObject('player', current_system[0], current_system[1])
-            player_obj.system_q = rand_q
-            player_obj.system_r = rand_r
-            systems[current_system].append(player_obj)
-            return player_obj
-
-    # Fallback: place at (0, 0)
+    # The shared placement helper picks a free, unblocked hex; (0, 0) on a full map
     player_obj = MapObject('player', current_system[0], current_system[1])
-    player_obj.system_q = 0
-    player_obj.system_r = 0
-    systems[current_system].append(player_obj)
+    add_system_object(systems, current_system, player_obj)
+    ctx.place_system_objects(current_system, systems, ctx.planet_orbits, ctx.hex_grid)
+    if player_obj.system_q is None or player_obj.system_r is None:
+        player_obj.system_q, player_obj.system_r = 0, 0
     return player_obj
 
 
@@ -477,7 +463,6 @@ def _perform_system_scan(ctx: EventContext):
     hex_grid = ctx.hex_grid
     systems = ctx.systems
     planet_orbits = ctx.planet_orbits
-    planet_anim_state = ctx.planet_anim_state
 
     game_state.scan.scanned_systems.add(current_system)
     add_event_log("System scan complete. No enemies targeted - right-click enemies to target them for detailed scans.")
@@ -495,85 +480,23 @@ def _perform_system_scan(ctx: EventContext):
     # Preserve existing player ship position if it exists
     existing_player = None
     if current_system in systems:
-        existing_player = next((obj for obj in systems[current_system] if obj.type == 'player'), None)
+        existing_player = find_system_player(systems, current_system)
 
-    # Assign random system positions to non-player objects
-    for obj in system_objs:
-        if obj.type == 'player' and existing_player:
-            obj.system_q = existing_player.system_q
-            obj.system_r = existing_player.system_r
-        else:
-            obj.system_q = random.randint(0, hex_grid.cols - 1)
-            obj.system_r = random.randint(0, hex_grid.rows - 1)
-
-    # Handle planet visibility
-    planets_in_hex = [orbit['planet'] for orbit in planet_orbits if orbit['star'] == current_system]
-    for planet_coord in planets_in_hex:
-        existing_orbit = next((orbit for orbit in planet_orbits if orbit['planet'] == planet_coord), None)
-        if not existing_orbit:
-            new_orbit = {
-                'star': current_system,
-                'planet': planet_coord,
-                'hex_radius': random.randint(8, 15),
-                'angle': random.uniform(0, 2 * math.pi),
-                'speed': random.uniform(0.02, 0.1)
-            }
-            planet_orbits.append(new_orbit)
-            planet_anim_state[(current_system, planet_coord)] = new_orbit['angle']
-
-    # Update systems
+    if existing_player:
+        for obj in system_objs:
+            if obj.type == 'player':
+                obj.system_q = existing_player.system_q
+                obj.system_r = existing_player.system_r
+
+    # Update systems; everything else gets a free hex from the shared placement helper
     systems[current_system] = system_objs
-    game_state.system_object_states[current_system] = [
-        {
-            'type': obj.type,
-            'q': obj.q,
-            'r': obj.r,
-            'system_q': obj.system_q,
-            'system_r': obj.system_r,
-            'props': obj.props
-        } for obj in system_objs
-    ]
+    ctx.place_system_objects(current_system, systems, planet_orbits, hex_grid)
+    game_state.record_system_objects(current_system, system_objs)
 
     # Ensure player object exists
-    player_obj = next((obj for obj in systems[current_system] if obj.type == 'player'), None)
+    player_obj = find_system_player(systems, current_system)
     if player_obj is None:
-        _place_player_in_system(ctx)
-
-
-def _place_player_in_system(ctx: EventContext):
-    """Place player in current system at an unoccupied hex."""
-    current_system = ctx.current_system
-    systems = ctx.systems
-    hex_grid = ctx.hex_grid
-
-    occupied = set((getattr(obj, 'system_q', None), getattr(obj, 'system_r', None))
-                   for obj in systems[current_system]
-                   if hasattr(obj, 'system_q') and hasattr(obj, 'system_r'))
-
-    max_attempts = 100
-    for _ in range(max_attempts):
-        rand_q = random.randint(0, hex_grid.cols - 1)
-        rand_r = random.randint(0, hex_grid.rows - 1)
-        blocked, _ = ctx.is_hex_blocked(rand_q, rand_r, current_system, systems,
-                                        ctx.planet_orbits, hex_grid)
-        if (rand_q, rand_r) not in occupied and not blocked:
-            player_obj = MapObject('player', current_system[0], current_system[1])
-            player_obj.system_q = rand_q
-            player_obj.system_r = rand_r
-            systems[current_system].append(player_obj)
-            return
-
-    # Fallback: find any unblocked hex
-    for attempt_q in range(hex_grid.cols):
-        for attempt_r in range(hex_grid.rows):
-            blocked, _ = ctx.is_hex_blocked(attempt_q, attempt_r, current_system,
-                                           systems, ctx.planet_orbits, hex_grid)
-            if not blocked:
-                player_obj = MapObject('player', current_system[0], current_system[1])
-                player_obj.system_q = attempt_q
-                player_obj.system_r = attempt_r
-                systems[current_system].append(player_obj)
-                return
+        _ensure_player_object(ctx)
 
 
 def handle_toggle_click(ctx: EventContext) -> bool:
@@ -674,7 +597,7 @@ def handle_sector_map_click(mx: int, my: int, ctx: EventContext, result: EventRe
 
         game_state.animation.dest_q, game_state.animation.dest_r = q, r
         game_state.animation.ship_moving = True
-        game_state.animation.move_start_time = pygame.time.get_ticks()
+        game_state.animation.move_start_time = ctx.current_time
         game_state.animation.move_duration_ms = movement_duration
 
         result.trajectory_start_x = game_state.animation.ship_anim_x
@@ -706,7 +629,7 @@ def handle_system_map_click(mx: int, my: int, ctx: EventContext, result: EventRe
     systems = ctx.systems
     planet_orbits = ctx.planet_orbits
 
-    player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+    player_obj = find_system_player(systems, current_system)
     if player_obj is None:
         return False
 
@@ -738,12 +661,9 @@ def handle_system_map_click(mx: int, my: int, ctx: EventContext, result: EventRe
 def _handle_planet_click(q: int, r: int, ctx: EventContext, result: EventResult) -> bool:
     """Handle clicking on a planet hex."""
     game_state = ctx.game_state
-    hex_grid = ctx.hex_grid
     add_event_log = ctx.add_event_log
     current_system = ctx.current_system
     systems = ctx.systems
-    planet_orbits = ctx.planet_orbits
-    planet_anim_state = ctx.planet_anim_state
     player_ship = ctx.player_ship
 
     wants_orbit = show_orbit_dialog(ctx.screen, ctx.font)
@@ -752,39 +672,52 @@ def _handle_planet_click(q: int, r: int, ctx: EventContext, result: EventResult)
         return True
 
     # Find the planet at this location
-    planets_in_system = [orbit for orbit in planet_orbits if orbit['star'] == current_system]
-    for orbit in planets_in_system:
-        star_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'star'), None)
-        if star_obj and hasattr(star_obj, 'system_q') and hasattr(star_obj, 'system_r'):
-            star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
-            hex_size = hex_grid.hex_size if hasattr(hex_grid, 'hex_size') else 20
-            orbit_radius_px = orbit['hex_radius'] * hex_size
-            key = (orbit['star'], orbit['planet'])
-            angle = planet_anim_state.get(key, orbit['angle'])
-            planet_px = star_px + orbit_radius_px * math.cos(angle)
-            planet_py = star_py + orbit_radius_px * math.sin(angle)
-
-            planet_q, planet_r = hex_grid.pixel_to_hex(planet_px, planet_py)
-            if planet_q is not None and planet_r is not None:
-                planet_hexes = get_planet_hexes(planet_q, planet_r)
-                if (q, r) in planet_hexes:
-                    current_player_obj = next((obj for obj in systems.get(current_system, [])
-                                              if obj.type == 'player'), None)
-
-                    if (current_player_obj and
-                        current_player_obj.system_q == q and
-                        current_player_obj.system_r == r):
-                        # Already at planet - start orbiting immediately
-                        _start_orbit(planet_px, planet_py, key, ctx, result)
-                    else:
-                        # Need to move to planet first
-                        _move_to_planet(q, r, planet_px, planet_py, key, current_player_obj, ctx, result)
-                    return True
+    planet_hit = _find_planet_at_hex(q, r, ctx)
+    if planet_hit is None:
+        add_event_log(f"Cannot find planet at ({q}, {r})")
+        return True
+
+    planet_px, planet_py, key = planet_hit
+    current_player_obj = find_system_player(systems, current_system)
 
-    add_event_log(f"Cannot find planet at ({q}, {r})")
+    if (current_player_obj and
+        current_player_obj.system_q == q and
+        current_player_obj.system_r == r):
+        # Already at planet - start orbiting immediately
+        _start_orbit(planet_px, planet_py, key, ctx, result)
+    else:
+        # Need to move to planet first
+        _move_to_planet(q, r, planet_px, planet_py, key, current_player_obj, ctx, result)
     return True
 
 
+def _find_planet_at_hex(q: int, r: int, ctx: EventContext):
+    """
+    Find the orbiting planet covering hex (q, r) in the current system.
+    Returns (planet_px, planet_py, orbit_key), or None if no planet is there.
+    """
+    hex_grid = ctx.hex_grid
+    current_system = ctx.current_system
+
+    star_obj = find_system_star(ctx.systems, current_system)
+    if star_obj is None or star_obj.system_q is None or star_obj.system_r is None:
+        return None
+
+    # The star centre is the same for every orbit, so resolve it once
+    star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
+    planet_anim_state = ctx.planet_anim_state
+    for key, orbit, orbit_radius_px in ctx.get_system_planet_orbits(current_system, ctx.planet_orbits, hex_grid):
+        angle = planet_anim_state.get(key, orbit['angle'])
+        planet_px = star_px + orbit_radius_px * math.cos(angle)
+        planet_py = star_py + orbit_radius_px * math.sin(angle)
+
+        planet_q, planet_r = hex_grid.pixel_to_hex(planet_px, planet_py)
+        if planet_q is not None and planet_r is not None:
+            if (q, r) in get_planet_hexes(planet_q, planet_r):
+                return planet_px, planet_py, key
+    return None
+
+
 def _start_orbit(planet_px: float, planet_py: float, key: tuple, ctx: EventContext, result: EventResult):
     """Start orbiting a planet."""
     game_state = ctx.game_state
@@ -793,7 +726,7 @@ def _start_orbit(planet_px: float, planet_py: float, key: tuple, ctx: EventConte
     current_system = ctx.current_system
     systems = ctx.systems
 
-    current_player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+    current_player_obj = find_system_player(systems, current_system)
 
     # Calculate initial orbital angle
     if ctx.system_ship_anim_x is not None and ctx.system_ship_anim_y is not None:
@@ -842,7 +775,7 @@ def _move_to_planet(q: int, r: int, planet_px: float, planet_py: float, key: tup
         result.system_dest_q = q
         result.system_dest_r = r
         result.system_ship_moving = True
-        result.system_move_start_time = pygame.time.get_ticks()
+        result.system_move_start_time = ctx.current_time
 
         if ctx.system_ship_anim_x is not None and ctx.system_ship_anim_y is not None:
             result.system_trajectory_start_x = ctx.system_ship_anim_x
@@ -946,7 +879,7 @@ def _handle_system_movement(q: int, r: int, player_obj, ctx: EventContext, resul
         result.system_dest_q = q
         result.system_dest_r = r
         result.system_ship_moving = True
-        result.system_move_start_time = pygame.time.get_ticks()
+        result.system_move_start_time = ctx.current_time
         result.system_move_duration_ms = movement_duration
 
         if ctx.system_ship_anim_x is not None and ctx.system_ship_anim_y is not None:
@@ -981,8 +914,6 @@ def handle_right_click(mx: int, my: int, ctx: EventContext) -> bool:
     add_event_log = ctx.add_event_log
     current_system = ctx.current_system
     systems = ctx.systems
-    planet_orbits = ctx.planet_orbits
-    planet_anim_state = ctx.planet_anim_state
     sound_manager = ctx.sound_manager
 
     if game_state.map_mode != 'system':
@@ -992,32 +923,20 @@ def handle_right_click(mx: int, my: int, ctx: EventContext) -> bool:
     if q is None or r is None:
         return False
 
+    # Objects grouped by type, so each check below only walks the objects it cares about
+    objects_by_type = get_system_objects_by_type(systems, current_system)
+    system_stars = objects_by_type.get('star', ())
+
     # Check for planets at clicked location
     scanned_celestial = False
-    planets_in_system = [orbit for orbit in planet_orbits if orbit['star'] == current_system]
-    for orbit in planets_in_system:
-        star_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'star'), None)
-        if star_obj and hasattr(star_obj, 'system_q') and hasattr(star_obj, 'system_r'):
-            star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
-            hex_size = hex_grid.hex_size if hasattr(hex_grid, 'hex_size') else 20
-            orbit_radius_px = orbit['hex_radius'] * hex_size
-            key = (orbit['star'], orbit['planet'])
-            angle = planet_anim_state.get(key, orbit['angle'])
-            planet_px = star_px + orbit_radius_px * math.cos(angle)
-            planet_py = star_py + orbit_radius_px * math.sin(angle)
-
-            planet_q, planet_r = hex_grid.pixel_to_hex(planet_px, planet_py)
-            if planet_q is not None and planet_r is not None:
-                planet_hexes = get_planet_hexes(planet_q, planet_r)
-                if (q, r) in planet_hexes:
-                    ctx.perform_planet_scan(q, r)
-                    scanned_celestial = True
-                    break
+    if _find_planet_at_hex(q, r, ctx) is not None:
+        ctx.perform_planet_scan(q, r)
+        scanned_celestial = True
 
     # Check for stars at clicked location
     if not scanned_celestial:
-        for obj in systems.get(current_system, []):
-            if obj.type == 'star' and hasattr(obj, 'system_q') and hasattr(obj, 'system_r'):
+        for obj in system_stars:
+            if obj.system_q is not None and obj.system_r is not None:
                 star_hexes = get_star_hexes(obj.system_q, obj.system_r)
                 if (q, r) in star_hexes:
                     ctx.perform_star_scan(obj.system_q, obj.system_r)
@@ -1028,12 +947,8 @@ def handle_right_click(mx: int, my: int, ctx: EventContext) -> bool:
         return True
 
     # Check for anomalies at clicked location
-    found_anomaly = None
-    for obj in systems.get(current_system, []):
-        if obj.type == 'anomaly' and hasattr(obj, 'system_q') and hasattr(obj, 'system_r'):
-            if obj.system_q == q and obj.system_r == r:
-                found_anomaly = obj
-                break
+    found_anomaly = next((obj for obj in objects_by_type.get('anomaly', ())
+                          if obj.system_q == q and obj.system_r == r), None)
 
     if found_anomaly is not None:
         # Anomaly found - scan it
@@ -1047,12 +962,8 @@ def handle_right_click(mx: int, my: int, ctx: EventContext) -> bool:
     game_state.set_torpedo_target_hex(q, r)
 
     # Find enemy at this hex
-    found_enemy = None
-    for obj in systems.get(current_system, []):
-        if obj.type == 'enemy' and hasattr(obj, 'system_q') and hasattr(obj, 'system_r'):
-            if obj.system_q == q and obj.system_r == r:
-                found_enemy = obj
-                break
+    found_enemy = next((obj for obj in objects_by_type.get('enemy', ())
+                        if obj.system_q == q and obj.system_r == r), None)
 
     if found_enemy is not None:
         # Check if enemy is cloaked - cloaked enemies can't be targeted with phasers
@@ -42,6 +42,28 @@ class HexGrid:
         self.offset_x = map_x + margin_left + (usable_width - self.grid_width) / 2
         self.offset_y = map_y + margin_top + (usable_height - self.grid_height) / 2
 
+        # Hex centers never change for a grid, so compute them all up front
+        self._hex_centers = {
+            (col, row): self._compute_hex_center(col, row)
+            for col in range(cols)
+            for row in range(rows)
+        }
+
+        # Pre-rendered grid outlines, keyed by (outline_color, alpha)
+        self._grid_surface_cache = {}
+
+        # Pre-rendered fog-of-war overlay and the state it was built from
+        self._fog_surface = None
+        self._fog_style = None
+        self._fog_revealed = frozenset()
+        self._fog_origin = (0, 0)
+
+        # Pre-rendered coordinate label blits, keyed by (font, color)
+        self._label_blits_cache = {}
+
+        # Map-sized surface with every hex filled in its own index, built on first use
+        self._hex_lookup_surface = None
+
     @property
     def hex_size(self):
         """Return the radius of a hex (for compatibility with code expecting hex_size)."""
@@ -49,6 +71,14 @@ class HexGrid:
     
     def get_hex_center(self, col, row):
         """Get the pixel coordinates of a hex center for flat-topped hexes."""
+        center = self._hex_centers.get((col, row))
+        if center is None:
+            # Off-grid coordinates are not in the lookup table
+            center = self._compute_hex_center(col, row)
+        return center
+
+    def _compute_hex_center(self, col, row):
+        """Calculate a hex center from the grid geometry."""
         x = self.offset_x + self.radius + col * 1.5 * self.radius
         y = (self.offset_y + self.radius * math.sqrt(3) / 2 +
              row * self.radius * math.sqrt(3))
@@ -75,24 +105,29 @@ class HexGrid:
             pygame.draw.polygon(surface, color, points, 2)
     
     def draw_grid(self, surface, outline_color=(180, 180, 220), alpha=255):
-        """Draw the entire hex grid with optional transparency."""
-        if alpha < 255:
-            # Create a temporary surface for alpha blending
-            temp_surface = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    cx, cy = self.get_hex_center(col, row)
-                    # Draw on temp surface with alpha
-                    color_with_alpha = (*outline_color, alpha)
-                    self.draw_hex_with_alpha(temp_surface, cx, cy, color_with_alpha)
-            # Blit the temp surface to the main surface
-            surface.blit(temp_surface, (0, 0))
-        else:
-            # Original drawing method for full opacity
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    cx, cy = self.get_hex_center(col, row)
-                    self.draw_hex(surface, cx, cy, outline_color)
+        """Draw the entire hex grid with optional transparency.
+
+        The outlines never change for a given grid, so they are rendered once
+        per (color, alpha) into a map-sized surface and blitted afterwards.
+        """
+        cache_key = (tuple(outline_color), alpha)
+        grid_surface = self._grid_surface_cache.get(cache_key)
+        if grid_surface is None:
+            grid_surface = self._render_grid_surface(outline_color, alpha)
+            self._grid_surface_cache[cache_key] = grid_surface
+        surface.blit(grid_surface, (self.map_x, self.map_y))
+
+    def _render_grid_surface(self, outline_color, alpha):
+        """Render all hex outlines into a transparent map-sized surface."""
+        grid_surface = pygame.Surface((self.map_size, self.map_size), pygame.SRCALPHA)
+        color_with_alpha = (*outline_color, alpha)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cx, cy = self.get_hex_center(col, row)
+                # Hex centers are in screen space; shift them into the map surface
+                self.draw_hex_with_alpha(grid_surface, cx - self.map_x, cy - self.map_y,
+                                         color_with_alpha)
+        return grid_surface
     
     def draw_hex_with_alpha(self, surface, center_x, center_y, color_with_alpha):
         """Draw a single flat-topped hexagon with alpha."""
@@ -109,6 +144,38 @@ class HexGrid:
     
     def pixel_to_hex(self, px, py):
         """Convert pixel coordinates to hex grid coordinates."""
+        # Pixels inside a hex are read straight from the lookup surface
+        x = px - self.map_x
+        y = py - self.map_y
+        if 0 <= x < self.map_size and 0 <= y < self.map_size:
+            if self._hex_lookup_surface is None:
+                self._hex_lookup_surface = self._render_hex_lookup_surface()
+            index = self._hex_lookup_surface.get_at_mapped((int(x), int(y)))
+            if index:
+                return divmod(index - 1, self.rows)
+        return self._compute_pixel_to_hex(px, py)
+
+    def _render_hex_lookup_surface(self):
+        """Fill each hex with its index (col * rows + row + 1) as a raw pixel value; 0 is off-grid.
+
+        Hexes are inset so pixels the polygon fill rounds onto a neighbour
+        stay 0 and are resolved by the neighbour search instead.
+        """
+        lookup = pygame.Surface((self.map_size, self.map_size), depth=32)
+        lookup.fill(0)
+        inset_radius = self.radius - 3
+        for col in range(self.cols):
+            for row in range(self.rows):
+                cx, cy = self.get_hex_center(col, row)
+                cx -= self.map_x
+                cy -= self.map_y
+                points = [(cx + inset_radius * math.cos(math.pi / 3 * i),
+                           cy + inset_radius * math.sin(math.pi / 3 * i)) for i in range(6)]
+                pygame.draw.polygon(lookup, col * self.rows + row + 1, points)
+        return lookup
+
+    def _compute_pixel_to_hex(self, px, py):
+        """Find the hex nearest a pixel from the grid geometry."""
         # Adjust for grid offset
         px -= self.offset_x
         py -= self.offset_y
@@ -168,12 +235,70 @@ class HexGrid:
         blit_y = int(center_y - hex_diameter // 2)
         surface.blit(fog_surf, (blit_x, blit_y))
 
+    def draw_fog(self, surface, revealed_hexes, color=(200, 200, 200), alpha=153):
+        """Draw fog-of-war over every hex not in revealed_hexes as a single blit.
+
+        The overlay is built from the same per-hex alpha surfaces as draw_fog_hex,
+        so neighbouring hexes still double up along their shared edges, and it
+        is rebuilt in full whenever the style or the revealed set changes.
+        """
+        style = (tuple(color), alpha)
+        if self._fog_surface is None or style != self._fog_style or revealed_hexes != self._fog_revealed:
+            self._fog_surface = self._build_fog_overlay(revealed_hexes, color, alpha)
+            self._fog_style = style
+            self._fog_revealed = frozenset(revealed_hexes)
+        surface.blit(self._fog_surface, self._fog_origin)
+
+    def _build_fog_overlay(self, revealed_hexes, color, alpha):
+        """Composite the fog hex of every unrevealed hex onto one transparent surface."""
+        hex_diameter = int(self.radius * 2) + 4  # Same footprint as draw_fog_hex
+        fog_surf = pygame.Surface((hex_diameter, hex_diameter), pygame.SRCALPHA)
+        points = []
+        for i in range(6):
+            angle = math.pi / 3 * i
+            points.append((hex_diameter // 2 + self.radius * math.cos(angle),
+                           hex_diameter // 2 + self.radius * math.sin(angle)))
+        pygame.draw.polygon(fog_surf, (*color, alpha), points)
+
+        # Pad the overlay so hexes on the map edge are not clipped
+        origin_x = int(self.map_x) - hex_diameter
+        origin_y = int(self.map_y) - hex_diameter
+        overlay = pygame.Surface((int(self.map_size) + hex_diameter * 2,
+                                  int(self.map_size) + hex_diameter * 2), pygame.SRCALPHA)
+        blits = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if (col, row) not in revealed_hexes:
+                    cx, cy = self.get_hex_center(col, row)
+                    blits.append((fog_surf, (int(cx - hex_diameter // 2) - origin_x,
+                                             int(cy - hex_diameter // 2) - origin_y)))
+        overlay.blits(blits, doreturn=False)
+
+        # Crop to the fogged area so fully revealed edges aren't blended every frame
+        fogged = overlay.get_bounding_rect()
+        self._fog_origin = (origin_x + fogged.x, origin_y + fogged.y)
+        return overlay.subsurface(fogged).copy()
+
     def draw_coordinate_labels(self, surface, font=None, color=(150, 150, 180)):
-        """Draw X (column) and Y (row) coordinate labels along the edges of the grid."""
+        """Draw X (column) and Y (row) coordinate labels along the edges of the grid.
+
+        The labels are rendered once per (font, color) and drawn with a single
+        surface.blits() call afterwards.
+        """
+        cache_key = (font, tuple(color))
+        label_blits = self._label_blits_cache.get(cache_key)
+        if label_blits is None:
+            label_blits = self._render_coordinate_labels(font, color)
+            self._label_blits_cache[cache_key] = label_blits
+        surface.blits(label_blits, doreturn=False)
+
+    def _render_coordinate_labels(self, font, color):
+        """Render every coordinate label and return (text_surface, rect) pairs."""
         if font is None:
             font = pygame.font.SysFont('arial', 10)
+        label_blits = []
 
-        # Draw X-axis labels (columns) along the top
+        # X-axis labels (columns) along the top
         for col in range(self.cols):
             # Get the center of the hex in the first row for this column
             cx, _ = self.get_hex_center(col, 0)
@@ -182,9 +307,9 @@ class HexGrid:
             label_text = str(col)
             text_surface = font.render(label_text, True, color)
             text_rect = text_surface.get_rect(center=(cx, label_y))
-            surface.blit(text_surface, text_rect)
+            label_blits.append((text_surface, text_rect))
 
-        # Draw Y-axis labels (rows) along the left side
+        # Y-axis labels (rows) along the left side
         for row in range(self.rows):
             # Get the center of the hex in the first column for this row
             _, cy = self.get_hex_center(0, row)
@@ -193,7 +318,8 @@ class HexGrid:
             label_text = str(row)
             text_surface = font.render(label_text, True, color)
             text_rect = text_surface.get_rect(center=(label_x, cy))
-            surface.blit(text_surface, text_rect)
+            label_blits.append((text_surface, text_rect))
+        return label_blits
 
 
 def create_hex_grid_for_map(map_x, map_y, map_size, rows=20, cols=20, margin_left=25, margin_top=20):
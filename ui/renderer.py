@@ -11,7 +11,8 @@ import time
 
 from ui.hex_utils import get_star_hexes
 from ui.drawing_utils import get_star_color, get_planet_color
-from ui.text_utils import wrap_text
+from ui.text_utils import wrap_text, render_text
+from galaxy_generation.map_object import find_system_player, find_system_star
 
 
 class RenderContext:
@@ -87,6 +88,15 @@ class RenderContext:
 
         # Event log max lines
         self.event_log_max_lines = 20
+        # The whole event log panel, rendered once and rebuilt only when the visible log changes
+        self.event_log_lines = None
+        self.event_log_surface = None
+        # Status bar readouts that change over time: slot -> (text, rendered surface)
+        self.status_value_surfaces = {}
+        # Static panel chrome (background, border, label) rendered once per panel: name -> Surface
+        self.panel_surfaces = {}
+        # Rendered wrapped surfaces per log message, keyed by (message, wrap width)
+        self.event_log_line_cache = {}
 
         # Button panel settings
         self.control_panel_label_spacer = 50
@@ -99,6 +109,20 @@ class RenderContext:
         self.toggle_btn_y = 50
 
 
+def _render_status_value(ctx, slot, font, text, color):
+    """Render a changing status bar readout, reusing the surface until its text changes.
+
+    Countdowns and the stardate change a few times a second at most, so most
+    frames reuse the previous surface. Only the latest text per slot is kept.
+    """
+    cached = ctx.status_value_surfaces.get(slot)
+    if cached is not None and cached[0] == text:
+        return cached[1]
+    surface = font.render(text, True, color)
+    ctx.status_value_surfaces[slot] = (text, surface)
+    return surface
+
+
 def draw_status_bar(ctx):
     """Draw the status/tooltip panel at the top of the screen.
 
@@ -122,7 +146,7 @@ def draw_status_bar(ctx):
         sector_x, sector_y = ctx.game_state.current_system
         sector_coords = f"  [Sector {sector_x},{sector_y}]"
 
-    status_label = label_font.render(f'Status/Tooltip Panel{sector_coords}', True, ctx.color_text)
+    status_label = render_text(label_font, f'Status/Tooltip Panel{sector_coords}', ctx.color_text)
     screen.blit(status_label, (10, 8))
 
     # Weapon Cooldown Display (just left of stardate)
@@ -134,7 +158,8 @@ def draw_status_bar(ctx):
         cooldown_time = (player_ship.phaser_system._last_fired_time +
                          player_ship.phaser_system.cooldown_seconds) - time.time()
         if cooldown_time > 0:
-            cooldown_label = font.render(f"Phasers: {cooldown_time:.1f}s", True, (255, 255, 0))
+            cooldown_label = _render_status_value(ctx, 'phaser_cooldown', font,
+                                                  f"Phasers: {cooldown_time:.1f}s", (255, 255, 0))
             screen.blit(cooldown_label, (cooldown_x, cooldown_y))
             cooldown_y += 20
 
@@ -143,11 +168,12 @@ def draw_status_bar(ctx):
         cooldown_time = (player_ship.torpedo_system._last_fired_time +
                          player_ship.torpedo_system.cooldown_seconds) - time.time()
         if cooldown_time > 0:
-            cooldown_label = font.render(f"Torpedoes: {cooldown_time:.1f}s", True, (255, 100, 100))
+            cooldown_label = _render_status_value(ctx, 'torpedo_cooldown', font,
+                                                  f"Torpedoes: {cooldown_time:.1f}s", (255, 100, 100))
             screen.blit(cooldown_label, (cooldown_x, cooldown_y))
 
     # Stardate Display
-    stardate_label = font.render(stardate_system.format_stardate(), True, ctx.color_text)
+    stardate_label = _render_status_value(ctx, 'stardate', font, stardate_system.format_stardate(), ctx.color_text)
     screen.blit(stardate_label, (width - 180, 8))
 
 
@@ -199,7 +225,7 @@ def _draw_system_stars_background(ctx):
 
     for obj in systems.get(current_system, []):
         if obj.type == 'star':
-            if not hasattr(obj, 'system_q') or not hasattr(obj, 'system_r'):
+            if obj.system_q is None or obj.system_r is None:
                 obj.system_q = random.randint(1, hex_grid.cols - 2)
                 obj.system_r = random.randint(1, hex_grid.rows - 2)
 
@@ -219,7 +245,7 @@ def _draw_system_stars_background(ctx):
                 center_y = sum_y / len(valid_hexes)
 
                 # Get or assign star image
-                if not hasattr(obj, 'star_image'):
+                if obj.star_image is None:
                     obj.star_image = background_loader.get_random_star_image()
                     obj.scaled_star_image = None
 
@@ -235,13 +261,13 @@ def _draw_system_stars_background(ctx):
                         image_rect.center = (int(center_x), int(center_y))
                         screen.blit(obj.scaled_star_image, image_rect)
                     else:
-                        if not hasattr(obj, 'color'):
+                        if obj.color is None:
                             obj.color = get_star_color()
                         pygame.draw.circle(screen, obj.color,
                                           (int(center_x), int(center_y)),
                                           int(hex_grid.radius * 3.6))
                 else:
-                    if not hasattr(obj, 'color'):
+                    if obj.color is None:
                         obj.color = get_star_color()
                     pygame.draw.circle(screen, obj.color,
                                       (int(center_x), int(center_y)),
@@ -260,11 +286,7 @@ def draw_fog_of_war(ctx):
 
     # Only apply fog of war to sector map, not system maps
     if game_state.map_mode == 'sector':
-        for row in range(hex_grid.rows):
-            for col in range(hex_grid.cols):
-                if (col, row) not in game_state.scan.scanned_systems:
-                    cx, cy = hex_grid.get_hex_center(col, row)
-                    hex_grid.draw_fog_hex(screen, cx, cy, color=(200, 200, 200), alpha=25)
+        hex_grid.draw_fog(screen, game_state.scan.scanned_systems, color=(200, 200, 200), alpha=25)
 
 
 def draw_sector_objects(ctx, add_event_log_func=None):
@@ -403,35 +425,66 @@ def draw_event_log_panel(ctx):
     """
     screen = ctx.screen
     game_state = ctx.game_state
-    label_font = ctx.label_font
-    small_font = ctx.small_font
-
-    # Right-side Event Log Panel
-    right_event_rect = pygame.Rect(ctx.event_log_x, ctx.event_log_y,
-                                   ctx.event_log_width, ctx.event_log_height)
-    pygame.draw.rect(screen, ctx.color_event_log, right_event_rect)
-    pygame.draw.rect(screen, ctx.color_event_log_border, right_event_rect, 2)
-    event_label = label_font.render('Event Log', True, ctx.color_text)
-    screen.blit(event_label, (ctx.event_log_x + 20, ctx.event_log_y + 20))
-
-    # Draw event log lines with text wrapping
-    log_font = small_font
+
+    # The panel is only redrawn when the visible log changes; otherwise it is one blit
+    visible_log = tuple(game_state.ui.event_log)
+    if len(visible_log) > ctx.event_log_max_lines:
+        visible_log = visible_log[-ctx.event_log_max_lines:]
+    panel_size = (ctx.event_log_width, ctx.event_log_height)
+    if (ctx.event_log_surface is None or visible_log != ctx.event_log_lines
+            or ctx.event_log_surface.get_size() != panel_size):
+        ctx.event_log_surface = _build_event_log_surface(ctx, visible_log, panel_size)
+        ctx.event_log_lines = visible_log
+    screen.blit(ctx.event_log_surface, (ctx.event_log_x, ctx.event_log_y))
+
+
+def _build_event_log_surface(ctx, log_lines, panel_size):
+    """Render the event log panel (background, border, label and lines) to a surface."""
+    panel = pygame.Surface(panel_size)
+    panel_rect = panel.get_rect()
+    pygame.draw.rect(panel, ctx.color_event_log, panel_rect)
+    pygame.draw.rect(panel, ctx.color_event_log_border, panel_rect, 2)
+    panel.blit(render_text(ctx.label_font, 'Event Log', ctx.color_text), (20, 20))
+    panel.blits(_build_event_log_blits(ctx, log_lines, ctx.small_font), doreturn=False)
+    return panel
+
+
+def _build_event_log_blits(ctx, log_lines, log_font):
+    """Wrap and render event log lines, returning (surface, position) pairs relative to the panel."""
     log_area_width = ctx.event_log_width - 40
-    y_offset = ctx.event_log_y + 50
+    y_offset = 50
     line_height = 20
 
-    rendered_lines = 0
-    for line in game_state.ui.event_log[-ctx.event_log_max_lines:]:
-        if rendered_lines >= ctx.event_log_max_lines:
+    # Messages still on screen keep their surfaces; only new ones are wrapped and
+    # rendered, and messages that scrolled out of the window are dropped
+    previous_cache = ctx.event_log_line_cache
+    line_cache = {}
+    log_blits = []
+    for line in log_lines:
+        if len(log_blits) >= ctx.event_log_max_lines:
             break
 
-        wrapped_lines = wrap_text(line, log_area_width, log_font)
-        for wrapped_line in wrapped_lines:
-            if rendered_lines >= ctx.event_log_max_lines:
+        cache_key = (line, log_area_width)
+        line_surfaces = line_cache.get(cache_key) or previous_cache.get(cache_key)
+        if line_surfaces is None:
+            line_surfaces = [log_font.render(wrapped_line, True, ctx.color_text)
+                             for wrapped_line in wrap_text(line, log_area_width, log_font)]
+        line_cache[cache_key] = line_surfaces
+        for text_surface in line_surfaces:
+            if len(log_blits) >= ctx.event_log_max_lines:
                 break
-            text_surface = log_font.render(wrapped_line, True, ctx.color_text)
-            screen.blit(text_surface, (ctx.event_log_x + 20, y_offset + rendered_lines * line_height))
-            rendered_lines += 1
+            log_blits.append((text_surface, (20, y_offset + len(log_blits) * line_height)))
+    ctx.event_log_line_cache = line_cache
+    return log_blits
+
+
+def _get_panel_surface(ctx, name, size, build):
+    """Return the cached chrome surface for a panel, building it with build(surface) on first use."""
+    surface = ctx.panel_surfaces.get(name)
+    if surface is None or surface.get_size() != size:
+        surface = ctx.panel_surfaces[name] = pygame.Surface(size)
+        build(surface)
+    return surface
 
 
 def draw_popup_dock(ctx):
@@ -440,15 +493,15 @@ def draw_popup_dock(ctx):
     Args:
         ctx: RenderContext with all necessary state
     """
-    screen = ctx.screen
-    label_font = ctx.label_font
+    def build(panel):
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, (25, 25, 40), panel_rect)
+        pygame.draw.rect(panel, ctx.color_event_log_border, panel_rect, 2)
+        panel.blit(render_text(ctx.label_font, 'Scan Results', ctx.color_text), (20, 20))
 
-    popup_dock_rect = pygame.Rect(ctx.popup_dock_x, ctx.status_height,
-                                  ctx.enemy_scan_width, ctx.height - ctx.status_height)
-    pygame.draw.rect(screen, (25, 25, 40), popup_dock_rect)
-    pygame.draw.rect(screen, ctx.color_event_log_border, popup_dock_rect, 2)
-    dock_label = label_font.render('Scan Results', True, ctx.color_text)
-    screen.blit(dock_label, (ctx.popup_dock_x + 20, ctx.status_height + 20))
+    # The dock never changes, so it is rendered once and blitted each frame
+    panel = _get_panel_surface(ctx, 'popup_dock', (ctx.enemy_scan_width, ctx.height - ctx.status_height), build)
+    ctx.screen.blit(panel, (ctx.popup_dock_x, ctx.status_height))
 
 
 def draw_image_display_panel(ctx):
@@ -459,13 +512,13 @@ def draw_image_display_panel(ctx):
     """
     screen = ctx.screen
     font = ctx.font
-    label_font = ctx.label_font
 
-    image_rect = pygame.Rect(0, ctx.bottom_pane_y,
-                             ctx.image_display_width, ctx.bottom_pane_height)
-    pygame.draw.rect(screen, ctx.color_image_display, image_rect)
-    image_label = label_font.render('Target Image Display', True, ctx.color_text)
-    screen.blit(image_label, (20, ctx.bottom_pane_y + 20))
+    def build(panel):
+        panel.fill(ctx.color_image_display)
+        panel.blit(render_text(ctx.label_font, 'Target Image Display', ctx.color_text), (20, 20))
+
+    panel = _get_panel_surface(ctx, 'image_display', (ctx.image_display_width, ctx.bottom_pane_height), build)
+    screen.blit(panel, (0, ctx.bottom_pane_y))
 
     # Display scanned object image and info
     if ctx.current_scanned_object and ctx.current_scanned_image:
@@ -482,12 +535,12 @@ def draw_image_display_panel(ctx):
 
         # Display object information
         info_y = image_y + scaled_image.get_height() + 15
-        name_text = font.render(ctx.current_scanned_object['name'], True, ctx.color_text)
+        name_text = render_text(font, ctx.current_scanned_object['name'], ctx.color_text)
         screen.blit(name_text, (20, info_y))
         info_y += 20
 
         if ctx.current_scanned_object['type'] == 'planet':
-            class_text = font.render(f"Class {ctx.current_scanned_object['class']}", True, ctx.color_text)
+            class_text = render_text(font, f"Class {ctx.current_scanned_object['class']}", ctx.color_text)
             screen.blit(class_text, (20, info_y))
         elif ctx.current_scanned_object['type'] == 'anomaly':
             # Display danger level for anomalies
@@ -503,16 +556,16 @@ def draw_image_display_panel(ctx):
                 danger_color = (50, 255, 50)  # Green
             else:
                 danger_color = ctx.color_text
-            danger_text = font.render(f"Danger: {danger_level}", True, danger_color)
+            danger_text = render_text(font, f"Danger: {danger_level}", danger_color)
             screen.blit(danger_text, (20, info_y))
         elif 'class' in ctx.current_scanned_object:
-            class_text = font.render(
-                ctx.current_scanned_object['class'].replace('_', ' ').title(), True, ctx.color_text
+            class_text = render_text(
+                font, ctx.current_scanned_object['class'].replace('_', ' ').title(), ctx.color_text
             )
             screen.blit(class_text, (20, info_y))
     else:
         # Show instructions when no object is scanned
-        instruction_text = font.render('Right-click on a planet or star to scan', True, ctx.color_text)
+        instruction_text = render_text(font, 'Right-click on a planet or star to scan', ctx.color_text)
         screen.blit(instruction_text, (20, ctx.bottom_pane_y + 60))
 
 
@@ -522,22 +575,18 @@ def draw_control_panel(ctx):
     Args:
         ctx: RenderContext with all necessary state
     """
-    screen = ctx.screen
-    label_font = ctx.label_font
+    def build(panel):
+        panel.fill(ctx.color_control_panel)
+        panel.blit(render_text(ctx.label_font, 'Control Panel', ctx.color_text), (20, 20))
 
-    control_rect = pygame.Rect(ctx.image_display_width, ctx.bottom_pane_y,
-                               ctx.control_panel_width, ctx.bottom_pane_height)
-    pygame.draw.rect(screen, ctx.color_control_panel, control_rect)
-    control_label = label_font.render('Control Panel', True, ctx.color_text)
-    screen.blit(control_label, (ctx.image_display_width + 20, ctx.bottom_pane_y + 20))
+        # Draw border around button area
+        button_area_rect = pygame.Rect(30, ctx.control_panel_label_spacer - 10,
+                                       ctx.control_panel_width - 40,
+                                       ctx.bottom_pane_height - ctx.control_panel_label_spacer)
+        pygame.draw.rect(panel, ctx.color_button_area_border, button_area_rect, 2)
 
-    # Draw border around button area
-    button_area_x = ctx.image_display_width + 30
-    button_area_y = ctx.bottom_pane_y + ctx.control_panel_label_spacer - 10
-    button_area_width = ctx.control_panel_width - 40
-    button_area_height = ctx.bottom_pane_height - ctx.control_panel_label_spacer
-    button_area_rect = pygame.Rect(button_area_x, button_area_y, button_area_width, button_area_height)
-    pygame.draw.rect(screen, ctx.color_button_area_border, button_area_rect, 2)
+    panel = _get_panel_surface(ctx, 'control_panel', (ctx.control_panel_width, ctx.bottom_pane_height), build)
+    ctx.screen.blit(panel, (ctx.image_display_width, ctx.bottom_pane_y))
 
 
 def draw_destination_indicator(ctx):
@@ -583,7 +632,7 @@ def draw_phaser_animation(ctx, current_time, get_enemy_position_func):
 
     phaser_anim_data = game_state.weapon_animation_manager.get_phaser_animation_data(current_time)
     if phaser_anim_data and phaser_anim_data['active']:
-        player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+        player_obj = find_system_player(systems, current_system)
         if player_obj is not None:
             # Use animated position if available
             if ctx.system_ship_anim_x is not None and ctx.system_ship_anim_y is not None:
@@ -668,7 +717,7 @@ def draw_enemy_weapon_animations(ctx, current_time, get_enemy_position_func):
         if ctx.system_ship_anim_x is not None and ctx.system_ship_anim_y is not None:
             player_render_pos = (ctx.system_ship_anim_x, ctx.system_ship_anim_y)
         else:
-            player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+            player_obj = find_system_player(systems, current_system)
             if player_obj:
                 player_render_pos = hex_grid.get_hex_center(player_obj.system_q, player_obj.system_r)
     elif game_state.map_mode == 'sector':
@@ -707,13 +756,13 @@ def draw_system_planets(ctx, clock):
 
     for orbit in planets_in_system:
         # Get star position in system coordinates
-        star_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'star'), None)
-        if star_obj and hasattr(star_obj, 'system_q') and hasattr(star_obj, 'system_r'):
+        star_obj = find_system_star(systems, current_system)
+        if star_obj and star_obj.system_q is not None and star_obj.system_r is not None:
             star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
         else:
             star_px, star_py = hex_grid.get_hex_center(current_system[0], current_system[1])
 
-        hex_size = hex_grid.hex_size if hasattr(hex_grid, 'hex_size') else 20
+        hex_size = hex_grid.hex_size
         orbit_radius_px = orbit['hex_radius'] * hex_size
         key = (orbit['star'], orbit['planet'])
 
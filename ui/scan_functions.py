@@ -11,6 +11,7 @@ import random
 import pygame
 from data.constants import (PLANET_CLASSES, STAR_CLASSES, ANOMALY_CLASSES,
                             ENEMY_HULL_STRENGTH, ENEMY_SHIELD_CAPACITY)
+from galaxy_generation.map_object import find_system_player
 
 
 def perform_planet_scan(planet_q, planet_r, current_system, add_event_log, sound_manager):
@@ -199,9 +200,8 @@ def perform_enemy_scan(enemy_obj, enemy_id, systems, game_state, enemy_scan_pane
         player_ship: PlayerShip instance for accessing combat manager
     """
     # Calculate distance from player
-    player_obj = next((obj for obj in systems.get(game_state.current_system, [])
-                       if obj.type == 'player'), None)
-    if player_obj and hasattr(player_obj, 'system_q') and hasattr(player_obj, 'system_r'):
+    player_obj = find_system_player(systems, game_state.current_system)
+    if player_obj and player_obj.system_q is not None and player_obj.system_r is not None:
         dx = enemy_obj.system_q - player_obj.system_q
         dy = enemy_obj.system_r - player_obj.system_r
         distance = math.sqrt(dx * dx + dy * dy)
@@ -340,9 +340,9 @@ def get_enemy_current_position(enemy_obj, hex_grid, player_ship):
         return hex_grid.get_hex_center(dynamic_position[0], dynamic_position[1])
 
     # Fallback to legacy animation positions
-    if hasattr(enemy_obj, 'anim_px') and hasattr(enemy_obj, 'anim_py'):
+    if enemy_obj.anim_px is not None and enemy_obj.anim_py is not None:
         return (enemy_obj.anim_px, enemy_obj.anim_py)
-    elif hasattr(enemy_obj, 'system_q') and hasattr(enemy_obj, 'system_r'):
+    elif enemy_obj.system_q is not None and enemy_obj.system_r is not None:
         return hex_grid.get_hex_center(enemy_obj.system_q, enemy_obj.system_r)
     else:
         return hex_grid.get_hex_center(0, 0)
@@ -372,9 +372,8 @@ def update_enemy_scan_positions(enemy_scan_panel, systems, game_state, player_sh
                         scan_data['position'] = current_hex_pos
 
                         # Recalculate distance and bearing from player
-                        player_obj = next((o for o in systems.get(game_state.current_system, [])
-                                           if o.type == 'player'), None)
-                        if player_obj and hasattr(player_obj, 'system_q') and hasattr(player_obj, 'system_r'):
+                        player_obj = find_system_player(systems, game_state.current_system)
+                        if player_obj and player_obj.system_q is not None and player_obj.system_r is not None:
                             dx = current_hex_pos[0] - player_obj.system_q
                             dy = current_hex_pos[1] - player_obj.system_r
                             scan_data['distance'] = math.sqrt(dx * dx + dy * dy)
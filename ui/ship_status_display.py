@@ -4,6 +4,8 @@ PRD-compliant display for tactical decision making
 """
 
 import pygame
+
+from ui.text_utils import render_text
 from data.constants import *
 
 class ShipStatusDisplay:
@@ -21,6 +23,7 @@ class ShipStatusDisplay:
         self.font = font
         self.small_font = pygame.font.Font(None, 18)
         self.large_font = pygame.font.Font(None, 24)
+        self.tiny_font = pygame.font.Font(None, 14)  # MAX button labels
         
         # LCARS Colors
         self.bg_color = (20, 20, 40)        # Dark blue background
@@ -53,7 +56,7 @@ class ShipStatusDisplay:
                 title_text = f"*** {ship.name} DESTROYED ***"
                 title_color = (128, 128, 128)  # Gray for destroyed
         
-        title_surface = self.large_font.render(title_text, True, title_color)
+        title_surface = render_text(self.large_font, title_text, title_color)
         screen.blit(title_surface, (self.rect.x + 10, self.rect.y + 5))
         
         # Show warp core breach countdown if applicable
@@ -85,7 +88,7 @@ class ShipStatusDisplay:
     
     def draw_energy_status(self, screen, ship, y):
         """Draw warp core energy status."""
-        label = self.font.render("WARP CORE ENERGY", True, self.border_color)
+        label = render_text(self.font, "WARP CORE ENERGY", self.border_color)
         screen.blit(label, (self.rect.x + 10, y))
         
         # Energy bar
@@ -116,7 +119,7 @@ class ShipStatusDisplay:
             energy_text = f"{int(ship.warp_core_energy)}/{int(effective_max_energy)} (MAX: {int(ship.max_warp_core_energy)})"
         else:
             energy_text = f"{int(ship.warp_core_energy)}/{int(effective_max_energy)}"
-        text_surface = self.small_font.render(energy_text, True, self.text_color)
+        text_surface = render_text(self.small_font, energy_text, self.text_color)
         text_rect = text_surface.get_rect(center=bar_rect.center)
         screen.blit(text_surface, text_rect)
         
@@ -124,7 +127,7 @@ class ShipStatusDisplay:
     
     def draw_power_allocation(self, screen, ship, y):
         """Draw power allocation for all systems."""
-        label = self.font.render("POWER ALLOCATION", True, self.border_color)
+        label = render_text(self.font, "POWER ALLOCATION", self.border_color)
         screen.blit(label, (self.rect.x + 10, y))
         y += 25
         
@@ -134,7 +137,7 @@ class ShipStatusDisplay:
             power_level = ship.power_allocation.get(system, 0)
             
             # System name
-            system_text = self.small_font.render(f"{system.upper()}:", True, self.text_color)
+            system_text = render_text(self.small_font, f"{system.upper()}:", self.text_color)
             screen.blit(system_text, (self.rect.x + 10, y))
             
             # ON/OFF button (left of meter)
@@ -149,7 +152,7 @@ class ShipStatusDisplay:
                 pygame.draw.rect(screen, self.bar_bg_color, off_button_rect)
                 off_text = "0"
             pygame.draw.rect(screen, self.border_color, off_button_rect, 1)
-            off_label = self.small_font.render(off_text, True, self.text_color)
+            off_label = render_text(self.small_font, off_text, self.text_color)
             off_label_rect = off_label.get_rect(center=off_button_rect.center)
             screen.blit(off_label, off_label_rect)
             
@@ -193,13 +196,12 @@ class ShipStatusDisplay:
                 pygame.draw.rect(screen, self.bar_bg_color, max_button_rect)
             pygame.draw.rect(screen, self.border_color, max_button_rect, 1)
             # Use smaller font for MAX button
-            tiny_font = pygame.font.Font(None, 14)
-            max_label = tiny_font.render("MAX", True, self.text_color)
+            max_label = render_text(self.tiny_font, "MAX", self.text_color)
             max_label_rect = max_label.get_rect(center=max_button_rect.center)
             screen.blit(max_label, max_label_rect)
             
             # Power level number
-            level_text = self.small_font.render(str(power_level), True, self.text_color)
+            level_text = render_text(self.small_font, str(power_level), self.text_color)
             screen.blit(level_text, (bar_x + 145, y))
             
             y += 20
@@ -258,7 +260,7 @@ class ShipStatusDisplay:
     
     def draw_system_integrity(self, screen, ship, y):
         """Draw system integrity status."""
-        label = self.font.render("SYSTEM INTEGRITY", True, self.border_color)
+        label = render_text(self.font, "SYSTEM INTEGRITY", self.border_color)
         screen.blit(label, (self.rect.x + 10, y))
         y += 25
         
@@ -268,7 +270,7 @@ class ShipStatusDisplay:
             integrity = ship.system_integrity.get(system, 100)
             
             # System name
-            system_text = self.small_font.render(f"{system.upper()}:", True, self.text_color)
+            system_text = render_text(self.small_font, f"{system.upper()}:", self.text_color)
             screen.blit(system_text, (self.rect.x + 10, y))
             
             # Integrity bar
@@ -305,7 +307,7 @@ class ShipStatusDisplay:
             
             # Integrity text
             integrity_text = f"{integrity_value}/{max_value}"
-            text_surface = self.small_font.render(integrity_text, True, self.text_color)
+            text_surface = render_text(self.small_font, integrity_text, self.text_color)
             screen.blit(text_surface, (self.rect.x + 210, y))
             
             # Status indicator
@@ -322,7 +324,7 @@ class ShipStatusDisplay:
                 status_text = "NOMINAL"
                 status_color = self.good_color
             
-            status_surface = self.small_font.render(status_text, True, status_color)
+            status_surface = render_text(self.small_font, status_text, status_color)
             screen.blit(status_surface, (self.rect.x + 270, y))
             
             y += 18
@@ -331,7 +333,7 @@ class ShipStatusDisplay:
     
     def draw_shield_status(self, screen, ship, y):
         """Draw detailed shield status."""
-        label = self.font.render("SHIELD STATUS", True, self.border_color)
+        label = render_text(self.font, "SHIELD STATUS", self.border_color)
         screen.blit(label, (self.rect.x + 10, y))
         y += 25
         
@@ -339,7 +341,7 @@ class ShipStatusDisplay:
         
         # Shield Power Level
         power_text = f"Power Level: {shield.current_power_level}/{shield.max_power_level}"
-        power_surface = self.small_font.render(power_text, True, self.text_color)
+        power_surface = render_text(self.small_font, power_text, self.text_color)
         screen.blit(power_surface, (self.rect.x + 10, y))
         y += 18
         
@@ -352,7 +354,7 @@ class ShipStatusDisplay:
         # Shield Effectiveness
         absorption = shield.current_power_level * shield.absorption_per_level
         effect_text = f"Absorption: {absorption} damage per attack"
-        effect_surface = self.small_font.render(effect_text, True, self.text_color)
+        effect_surface = render_text(self.small_font, effect_text, self.text_color)
         screen.blit(effect_surface, (self.rect.x + 10, y))
         y += 18
         
@@ -367,14 +369,14 @@ class ShipStatusDisplay:
             status_text = "SHIELDS UP"
             status_color = self.good_color
         
-        status_surface = self.small_font.render(status_text, True, status_color)
+        status_surface = render_text(self.small_font, status_text, status_color)
         screen.blit(status_surface, (self.rect.x + 10, y))
         
         return y + 25
     
     def draw_weapon_status(self, screen, ship, y):
         """Draw weapon systems status."""
-        label = self.font.render("WEAPON STATUS", True, self.border_color)
+        label = render_text(self.font, "WEAPON STATUS", self.border_color)
         screen.blit(label, (self.rect.x + 10, y))
         y += 25
         
@@ -387,11 +389,13 @@ class ShipStatusDisplay:
                 cooldown_time = (phaser._last_fired_time + phaser.cooldown_seconds) - pygame.time.get_ticks() / 1000.0
                 status_text = f"PHASERS: RECHARGING ({cooldown_time:.1f}s)"
                 status_color = self.warning_color
+                # The countdown changes every frame, so don't fill the text cache with it
+                status_surface = self.small_font.render(status_text, True, status_color)
             else:
                 status_text = "PHASERS: READY"
                 status_color = self.good_color
+                status_surface = render_text(self.small_font, status_text, status_color)
             
-            status_surface = self.small_font.render(status_text, True, status_color)
             screen.blit(status_surface, (self.rect.x + 10, y))
             y += 18
             
@@ -399,7 +403,7 @@ class ShipStatusDisplay:
             power_level = ship.power_allocation.get('phasers', 5)
             power_modifier = power_level / 5.0
             range_text = f"Range: {phaser.range} hexes, Power: {power_modifier:.1f}x"
-            range_surface = self.small_font.render(range_text, True, self.text_color)
+            range_surface = render_text(self.small_font, range_text, self.text_color)
             screen.blit(range_surface, (self.rect.x + 10, y))
             y += 18
         
@@ -418,7 +422,7 @@ class ShipStatusDisplay:
                 efficiency_color = self.critical_color
             
             engine_text = f"ENGINE POWER: {engine_power}/9 - Efficiency: {efficiency:.1f}x"
-            engine_surface = self.small_font.render(engine_text, True, efficiency_color)
+            engine_surface = render_text(self.small_font, engine_text, efficiency_color)
             screen.blit(engine_surface, (self.rect.x + 10, y))
             y += 18
 
@@ -432,14 +436,14 @@ class ShipStatusDisplay:
                 torpedo_evasion = int(effective_evasion * ENGINE_EVASION_TORPEDO_MODIFIER * 100)
 
                 evasion_text = f"EVASION: {evasion_percent}% vs Phasers, {torpedo_evasion}% vs Torpedoes"
-                evasion_surface = self.small_font.render(evasion_text, True, (100, 255, 150))  # Light green
+                evasion_surface = render_text(self.small_font, evasion_text, (100, 255, 150))  # Light green
                 screen.blit(evasion_surface, (self.rect.x + 10, y))
                 y += 18
 
             # Engine status
             if engine_integrity < 100:
                 damage_text = f"Engine Damage: {100-engine_integrity:.0f}% (Reduces Speed)"
-                damage_surface = self.small_font.render(damage_text, True, self.critical_color)
+                damage_surface = render_text(self.small_font, damage_text, self.critical_color)
                 screen.blit(damage_surface, (self.rect.x + 10, y))
                 y += 18
         
@@ -459,7 +463,7 @@ class ShipStatusDisplay:
                 torpedo_color = self.critical_color
             
             torpedo_text = f"TORPEDOES: {torpedo_count}/{max_torpedoes}"
-            torpedo_surface = self.small_font.render(torpedo_text, True, torpedo_color)
+            torpedo_surface = render_text(self.small_font, torpedo_text, torpedo_color)
             screen.blit(torpedo_surface, (self.rect.x + 10, y))
             y += 18
             
@@ -474,7 +478,7 @@ class ShipStatusDisplay:
                 status_text = "READY"
                 status_color = self.good_color
             
-            status_surface = self.small_font.render(status_text, True, status_color)
+            status_surface = render_text(self.small_font, status_text, status_color)
             screen.blit(status_surface, (self.rect.x + 10, y))
         
         return y + 25
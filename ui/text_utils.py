@@ -1,6 +1,36 @@
+from collections import OrderedDict
+
+# Rendered text surfaces, keyed by (font, text, color), least recently used first
+_text_surface_cache = OrderedDict()
+_TEXT_SURFACE_CACHE_LIMIT = 512
+
+
+def render_text(font, text, color):
+    """Render antialiased text, reusing the surface when the same text was rendered before.
+
+    Meant for labels that repeat from frame to frame; text that changes every
+    frame should be rendered with font.render directly.
+    """
+    key = (font, text, tuple(color))
+    surface = _text_surface_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _text_surface_cache[key] = surface
+        if len(_text_surface_cache) > _TEXT_SURFACE_CACHE_LIMIT:
+            # Evict the least recently drawn text so the static labels stay cached
+            _text_surface_cache.popitem(last=False)
+    else:
+        _text_surface_cache.move_to_end(key)
+    return surface
+
+
 def wrap_text(text, max_width, font):
     """Wrap text to fit within max_width pixels."""
     words = text.split()
+    # Most log lines fit on one row; measure the whole text once before
+    # falling back to measuring word by word
+    if words and font.size(" ".join(words))[0] <= max_width:
+        return [" ".join(words)]
     lines = []
     current_line = ""
     
@@ -5,6 +5,7 @@ import os
 import traceback
 import logging
 import random
+from collections import Counter
 
 # Adjust the path to ensure imports work correctly
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -40,7 +41,8 @@ from ui.scan_functions import (perform_planet_scan as _perform_planet_scan,
                                 get_enemy_current_position as _get_enemy_current_position,
                                 update_enemy_scan_positions as _update_enemy_scan_positions,
                                 update_enemy_scan_stats as _update_enemy_scan_stats)
-from galaxy_generation.map_object import MapObject
+from galaxy_generation.map_object import (MapObject, add_system_object, remove_system_object,
+                                           find_system_player, find_system_star, get_system_objects_by_type)
 from ui.sound_manager import get_sound_manager
 from ui.ship_status_display import create_ship_status_display
 from ui.enemy_scan_panel import create_enemy_scan_panel
@@ -50,6 +52,11 @@ from game.game_state import GameState
 from data import constants
 from data.constants import STARTING_ENERGY, PLAYER_SHIELD_CAPACITY
 
+# Per-frame render diagnostics (frame timing, planet debug); off unless debugging rendering
+DEBUG_RENDER = False
+# Console chatter for UI clicks and targeting; off unless debugging input handling
+DEBUG_UI = False
+
 # Calculate compact window dimensions based on layout needs
 RIGHT_EVENT_LOG_WIDTH = 300
 SHIP_STATUS_WIDTH = 300     # Ship status panel width
@@ -82,6 +89,9 @@ COLOR_GRID_DEBUG = (0, 255, 0)     # Green for grid bounding box
 pygame.init()
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption('Star Trek Tactical Game - UI Wireframe')
+# The main loop polls the mouse and repaints every frame, so motion, focus and
+# expose events would only pad the queue
+pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE])
 
 # Use clean sans-serif system fonts for better readability
 font = pygame.font.SysFont('arial', 18)  # Regular font for general text
@@ -111,6 +121,8 @@ event_log_height = HEIGHT - STATUS_HEIGHT
 
 # Create the hex grid
 hex_grid = create_hex_grid_for_map(map_x, map_y, map_size, 20, 20)
+# Every (q, r) on the grid, used to find free hexes when placing system objects
+all_system_hexes = frozenset((q, r) for q in range(hex_grid.cols) for r in range(hex_grid.rows))
 
 # Create ship status display (takes upper portion)
 ship_status_x = map_size + event_log_width  # To the right of event log
@@ -151,6 +163,10 @@ enemy_scan_panel = create_enemy_scan_panel(
 # Generate map objects by system (now returns systems, star_coords, lazy_object_coords, planet_orbits)
 log_debug("Starting galaxy generation...")
 systems, star_coords, lazy_object_coords, planet_orbits = place_objects_by_system()
+# Every sector hex that holds a system (stars plus lazily generated objects;
+# planets orbit stars and are not systems of their own). The galaxy layout
+# is fixed after generation, so this is built once.
+all_system_coords = frozenset(star_coords).union(*lazy_object_coords.values())
 
 # Debug output for verification
 log_debug(f"Number of stars: {len(star_coords)}")
@@ -271,21 +287,21 @@ current_scanned_object = None
 current_scanned_image = None
 
 # Ensure systems[current_system] always contains at least a star object
-if current_system not in systems or not any(obj.type == 'star' for obj in systems[current_system]):
+if find_system_star(systems, current_system) is None:
     print(f"[INIT] Adding missing star object to systems at {current_system}")
     systems[current_system] = [MapObject('star', ship_q, ship_r)]
 
 # Ensure only one player object exists in the starting system
-if not any(obj.type == 'player' for obj in systems[current_system]):
+player_obj = find_system_player(systems, current_system)
+if player_obj is None:
     player_obj = MapObject('player', ship_q, ship_r)
     # Give player ship initial system coordinates
     player_obj.system_q = 10  # Center of 20x20 grid
     player_obj.system_r = 10
-    systems[current_system].append(player_obj)
+    add_system_object(systems, current_system, player_obj)
 else:
     # Ensure existing player has system coordinates
-    player_obj = next(obj for obj in systems[current_system] if obj.type == 'player')
-    if not hasattr(player_obj, 'system_q') or not hasattr(player_obj, 'system_r'):
+    if player_obj.system_q is None or player_obj.system_r is None:
         player_obj.system_q = 10  # Center of 20x20 grid
         player_obj.system_r = 10
 
@@ -325,6 +341,22 @@ SHIP_SPEED = max_distance / (2 * FPS)  # pixels per frame for 2s travel
 clock = pygame.time.Clock()
 move_frames = 2 * FPS  # 2 seconds at 60 FPS
 
+# Orbits advance in fixed simulation ticks, independent of the render rate;
+# drawing interpolates between the last two ticks
+SIM_DT = 1.0 / 60
+MAX_SIM_STEPS = 10  # Ticks run per frame at most, so a long stall doesn't spiral
+sim_accumulator = 0.0
+sim_steps = 0   # Fixed ticks to run this frame
+sim_alpha = 0.0  # Fraction of a tick elapsed since the last one
+
+def interpolate_orbit_angle(angle, speed):
+    """Return the angle to draw between the previous simulation tick and this one.
+
+    Orbits turn at a constant speed, so the previous tick's angle is one
+    tick's worth of rotation behind the current one.
+    """
+    return angle - speed * SIM_DT * (1.0 - sim_alpha)
+
 # Stardate system
 stardate_system = Stardate()
 
@@ -335,8 +367,6 @@ background_and_star_loader = BackgroundAndStarLoader()
 # Event log for displaying messages
 EVENT_LOG_MAX_LINES = 25  # Increased to accommodate wrapped text
 
-event_log = []
-
 # Track last system for debug print
 last_debug_system = None
 
@@ -349,6 +379,10 @@ planet_anim_state = { (orbit['star'], orbit['planet']): orbit['angle'] for orbit
 planet_colors = {}
 # Planet image storage
 planet_images_assigned = {}  # Dictionary: (star, planet) -> (image, scaled_image, size_multiplier)
+# Resolved planet sprite per planet: (star, planet) -> (surface, half_width, half_height)
+planet_sprites = {}
+# Where each planet of the current system was drawn this frame: (star, planet) -> (x, y)
+planet_positions = {}
 
 # Color generation functions imported from ui.drawing_utils:
 # get_star_color, get_planet_color
@@ -393,37 +427,221 @@ def update_enemy_scan_stats():
 # Hex utility functions imported from ui.hex_utils:
 # get_hex_neighbors, get_star_hexes, get_planet_hexes
 
-# is_hex_blocked defined locally because it uses module-level planet_anim_state
-def is_hex_blocked(q, r, current_system, systems, planet_orbits, hex_grid):
-    """Check if a hex is blocked by a star or planet."""
-    # Check stars
-    for obj in systems.get(current_system, []):
-        if obj.type == 'star' and hasattr(obj, 'system_q') and hasattr(obj, 'system_r'):
-            star_hexes = get_star_hexes(obj.system_q, obj.system_r)
-            if (q, r) in star_hexes:
-                return True, 'star'
-
-    # Check planets
-    planets_in_system = [orbit for orbit in planet_orbits if orbit['star'] == current_system]
-    for orbit in planets_in_system:
-        # Get star position to calculate planet position
-        star_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'star'), None)
-        if star_obj and hasattr(star_obj, 'system_q') and hasattr(star_obj, 'system_r'):
-            star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
-            hex_size = hex_grid.hex_size if hasattr(hex_grid, 'hex_size') else 20
-            orbit_radius_px = orbit['hex_radius'] * hex_size
+# Orbit constants grouped by system: system -> [(key, orbit, orbit_radius_px), ...]
+system_orbit_cache = {}
+system_orbit_cache_size = None  # len(planet_orbits) when the groups were built
+
+def get_system_planet_orbits(current_system, planet_orbits, hex_grid):
+    """Return (key, orbit, orbit_radius_px) for every planet orbiting in a system.
+
+    All orbits are grouped by star in one pass, with pixel radii precomputed,
+    and regrouped only when planet_orbits grows.
+    """
+    global system_orbit_cache_size
+    if system_orbit_cache_size != len(planet_orbits):
+        system_orbit_cache.clear()
+        hex_size = hex_grid.hex_size
+        for orbit in planet_orbits:
             key = (orbit['star'], orbit['planet'])
-            angle = planet_anim_state.get(key, orbit['angle'])
+            orbit_radius_px = orbit['hex_radius'] * hex_size
+            system_orbit_cache.setdefault(orbit['star'], []).append((key, orbit, orbit_radius_px))
+        system_orbit_cache_size = len(planet_orbits)
+    return system_orbit_cache.get(current_system, ())
+
+def get_system_stars(current_system, systems):
+    """Return the star objects in a system, from the per-system type index."""
+    return get_system_objects_by_type(systems, current_system).get('star', ())
+
+def get_system_star(current_system, systems, hex_grid):
+    """Return (star_obj, (star_px, star_py)) for a system's first star.
+
+    Returns (None, None) if the system has no positioned star.
+    """
+    star_obj = find_system_star(systems, current_system)
+    if star_obj is None or star_obj.system_q is None or star_obj.system_r is None:
+        return None, None
+    return star_obj, hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
+
+# Blocked hexes per system: system -> (star positions, planet angles, {hex: 'star' or 'planet'})
+system_blocked_cache = {}
+
+def get_system_blocked_hexes(current_system, systems, planet_orbits, hex_grid):
+    """Return {(q, r): reason} for every hex covered by a star or planet in a system.
+
+    Planet hexes follow the orbit angles, so the map is rebuilt only when a star
+    or planet has moved since it was cached.
+    """
+    star_positions = tuple((obj.system_q, obj.system_r) for obj in get_system_stars(current_system, systems)
+                           if obj.system_q is not None and obj.system_r is not None)
+    system_orbits = get_system_planet_orbits(current_system, planet_orbits, hex_grid)
+    angles = tuple(planet_anim_state.get(key, orbit['angle']) for key, orbit, _ in system_orbits)
+    cached = system_blocked_cache.get(current_system)
+    if cached is not None and cached[0] == star_positions and cached[1] == angles:
+        return cached[2]
+
+    blocked = {}
+    # Get star position to calculate planet positions
+    star_obj, star_center = get_system_star(current_system, systems, hex_grid)
+    if star_center is not None:
+        star_px, star_py = star_center
+        for (key, orbit, orbit_radius_px), angle in zip(system_orbits, angles):
             planet_px = star_px + orbit_radius_px * math.cos(angle)
             planet_py = star_py + orbit_radius_px * math.sin(angle)
             # Convert planet pixel position to hex
             planet_q, planet_r = hex_grid.pixel_to_hex(planet_px, planet_py)
             if planet_q is not None and planet_r is not None:
-                planet_hexes = get_planet_hexes(planet_q, planet_r)
-                if (q, r) in planet_hexes:
-                    return True, 'planet'
+                for planet_hex in get_planet_hexes(planet_q, planet_r):
+                    blocked[planet_hex] = 'planet'
+    # Stars take precedence over planets sharing a hex
+    for star_q, star_r in star_positions:
+        for star_hex in get_star_hexes(star_q, star_r):
+            blocked[star_hex] = 'star'
+    system_blocked_cache[current_system] = (star_positions, angles, blocked)
+    return blocked
+
+# is_hex_blocked defined locally because it uses module-level planet_anim_state
+def is_hex_blocked(q, r, current_system, systems, planet_orbits, hex_grid):
+    """Check if a hex is blocked by a star or planet."""
+    reason = get_system_blocked_hexes(current_system, systems, planet_orbits, hex_grid).get((q, r))
+    if reason is None:
+        return False, None
+    return True, reason
+
+def place_system_objects(current_system, systems, planet_orbits, hex_grid):
+    """Give every unplaced object in a system a random, unoccupied hex.
+
+    Runs when a system's objects are generated so the render loop only reads
+    positions. Stars are kept away from the edges; everything else avoids
+    star and planet hexes and the other objects.
+    """
+    system_objs = systems.get(current_system, [])
+    for obj in get_system_stars(current_system, systems):
+        if obj.system_q is None or obj.system_r is None:
+            # Stars need more space, place them away from edges
+            obj.system_q = random.randint(2, hex_grid.cols - 3)
+            obj.system_r = random.randint(2, hex_grid.rows - 3)
+    unplaced = [obj for obj in system_objs
+                if obj.type != 'star' and (obj.system_q is None or obj.system_r is None)]
+    if not unplaced:
+        return
+    occupied = {(obj.system_q, obj.system_r) for obj in system_objs
+                if obj.type != 'star' and obj.system_q is not None and obj.system_r is not None}
+    blocked_hexes = get_system_blocked_hexes(current_system, systems, planet_orbits, hex_grid)
+    free_hexes = sorted(all_system_hexes - occupied - blocked_hexes.keys())
+    for obj in unplaced:
+        if not free_hexes:
+            break
+        obj.system_q, obj.system_r = free_hexes.pop(random.randrange(len(free_hexes)))
+
+# Filled circle sprites keyed by (color, radius), used instead of per-frame draw.circle calls
+circle_sprite_cache = {}
+
+def get_circle_sprite(color, radius):
+    """Return a cached sprite of a filled circle; blit it at (x - radius, y - radius)."""
+    key = (tuple(color), radius)
+    sprite = circle_sprite_cache.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        circle_sprite_cache[key] = sprite
+    return sprite
+
+def build_triangle_sprite(color, size):
+    """Pre-render an enemy fallback triangle; returns (surface, anchor_x, anchor_y).
+
+    Blitting the surface at (x - anchor_x, y - anchor_y) matches the polygon drawn
+    with its tip at (x, y - size).
+    """
+    half_w = int(size * 0.75)
+    base = int(size * 0.5)
+    sprite = pygame.Surface((half_w * 2 + 1, size + base + 1), pygame.SRCALPHA)
+    pygame.draw.polygon(sprite, color, [(half_w, 0), (0, size + base), (half_w * 2, size + base)])
+    return sprite, half_w, size
+
+def build_square_sprite(color, size):
+    """Pre-render a filled square; returns (surface, anchor_x, anchor_y) for centring on a point."""
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    sprite.fill(color)
+    return sprite, size // 2, size // 2
+
+# Fallback shapes for system objects whose images are unavailable: name -> (surface, anchor_x, anchor_y)
+FALLBACK_OBJECT_SPRITES = {
+    'starbase': build_square_sprite((0, 0, 255), 12),
+    'enemy_klingon': build_triangle_sprite((255, 0, 0), 8),
+    'enemy_romulan': build_triangle_sprite((0, 200, 0), 12),  # Romulans larger
+    'player': (get_circle_sprite((0, 255, 255), 8), 8, 8),
+}
+
+def fallback_sprite_blit(name, x, y):
+    """Return the (sprite, position) pair that draws a fallback shape centred on its anchor at (x, y)."""
+    sprite, anchor_x, anchor_y = FALLBACK_OBJECT_SPRITES[name]
+    return sprite, (int(x) - anchor_x, int(y) - anchor_y)
+
+def build_planet_sprite(planet_key):
+    """Pick a planet's image (or fallback circle) and return (surface, half_width, half_height)."""
+    # Get or assign planet image and size for maximum variety
+    if planet_key not in planet_images_assigned:
+        # Assign a random planet image for maximum variety
+        planet_image = background_and_star_loader.get_random_planet_image()
+        # Assign random size: 1.0 (minimum/current size) to 3.3 (roughly 2 hex widths)
+        size_multiplier = random.uniform(1.0, 3.3)
+        scaled_planet_image = None
+        if planet_image:
+            scaled_planet_image = background_and_star_loader.scale_planet_image(
+                planet_image, hex_grid.radius * 1.8, size_multiplier
+            )
+        planet_images_assigned[planet_key] = (planet_image, scaled_planet_image, size_multiplier)
+        logging.debug(f"[PLANETS] Assigned random planet image to {planet_key} with size multiplier {size_multiplier:.2f}")
+    else:
+        planet_image, scaled_planet_image, size_multiplier = planet_images_assigned[planet_key]
+
+    # Use the planet image if available, otherwise fallback to circle
+    if scaled_planet_image:
+        # Same offsets as centering the image's rect on the planet position
+        return scaled_planet_image, scaled_planet_image.get_width() // 2, scaled_planet_image.get_height() // 2
+    if planet_key not in planet_colors:
+        planet_colors[planet_key] = get_planet_color()
+    # Use the same variable sizing for consistency
+    base_radius = hex_grid.radius * 1.8 * 0.6  # Base size
+    variable_radius = int(base_radius * size_multiplier)
+    return get_circle_sprite(planet_colors[planet_key], variable_radius), variable_radius, variable_radius
+
+# Sector map system indicators, built on the first draw after a sector scan
+SECTOR_INDICATOR_RADIUS = 6
+sector_indicator_blits = None
+
+def build_sector_indicator_blits():
+    """Build (sprite, position) pairs for every sector hex that holds a system.
+
+    Galaxy layout is fixed after generation, so the indicators are rendered
+    once and drawn each frame with a single screen.blits() call.
+    """
+    # Ensure starbase and anomaly systems are generated for sector map display
+    for obj_type in ('starbase', 'anomaly'):
+        for coord in lazy_object_coords.get(obj_type, ()):
+            if coord not in systems:
+                systems[coord] = generate_system_objects(
+                    coord[0], coord[1],
+                    lazy_object_coords,
+                    star_coords=star_coords,
+                    planet_orbits=planet_orbits,
+                    grid_size=hex_grid.cols
+                )
 
-    return False, None
+    radius = SECTOR_INDICATOR_RADIUS
+    blits = []
+    for q, r in all_system_coords:
+        object_types = {obj.type for obj in systems.get((q, r), [])}
+        # Light green for starbase, purple/magenta for anomaly, default gray for others
+        if 'starbase' in object_types:
+            dot_color = (144, 238, 144)
+        elif 'anomaly' in object_types:
+            dot_color = (180, 0, 255)
+        else:
+            dot_color = (100, 100, 130)
+        px, py = hex_grid.get_hex_center(q, r)
+        blits.append((get_circle_sprite(dot_color, radius), (int(px) - radius, int(py) - radius)))
+    return blits
 
 # show_orbit_dialog imported from ui.dialogs
 
@@ -484,10 +702,9 @@ def perform_anomaly_scan(anomaly_obj):
 
 
 def add_event_log(message):
-    # Split on newlines and handle each part
-    for line in message.split('\n'):
-        if line.strip():  # Only add non-empty lines
-            game_state.add_event_log(line.strip(), EVENT_LOG_MAX_LINES)
+    # Split on newlines and add the non-empty parts in one batch
+    game_state.add_event_logs([line.strip() for line in message.split('\n') if line.strip()],
+                              EVENT_LOG_MAX_LINES)
 
 logging.basicConfig(level=logging.DEBUG, format='[%(levelname)s] %(message)s')
 
@@ -538,6 +755,8 @@ event_ctx.perform_anomaly_scan = perform_anomaly_scan
 event_ctx.get_enemy_id = get_enemy_id
 event_ctx.get_enemy_current_position = get_enemy_current_position
 event_ctx.is_hex_blocked = is_hex_blocked
+event_ctx.place_system_objects = place_system_objects
+event_ctx.get_system_planet_orbits = get_system_planet_orbits
 
 # Set up weapon animation manager callback for evasion messages
 if game_state.weapon_animation_manager:
@@ -596,15 +815,25 @@ try:
     while running:
         screen.fill(COLOR_BG)
         
-        # Update weapon animations and handle combat events
+        # One timestamp for the whole frame, so every animation and event
+        # handled this frame agrees on the time
         current_time = pygame.time.get_ticks()
+        planet_positions.clear()
+
+        # Update weapon animations and handle combat events
         weapon_events = game_state.weapon_animation_manager.update(current_time, hex_grid)
         
         # Update enemy weapon animations (visual effects and damage application)
         game_state.weapon_animation_manager.update_enemy_animations(current_time)
         
         # Update ship systems and enemy AI continuously 
-        delta_time = clock.get_time() / 1000.0  # Convert milliseconds to seconds
+        delta_time = clock.get_time() / 1000.0  # Convert milliseconds to seconds; reused for the rest of the frame
+
+        # Work out how many fixed orbit ticks this frame covers
+        sim_accumulator += delta_time
+        sim_steps = min(int(sim_accumulator / SIM_DT), MAX_SIM_STEPS)
+        sim_accumulator = min(sim_accumulator - sim_steps * SIM_DT, SIM_DT)
+        sim_alpha = sim_accumulator / SIM_DT
         
         # Update player ship systems (shields, energy regeneration, repairs)
         if hasattr(player_ship, 'update'):
@@ -665,7 +894,7 @@ try:
                 add_event_log("Enemy ship destroyed!")
                 # Safely remove enemy from system (may already be removed by splash damage)
                 if phaser_event['target_enemy'] in systems[current_system]:
-                    systems[current_system].remove(phaser_event['target_enemy'])
+                    remove_system_object(systems, current_system, phaser_event['target_enemy'])
                 if enemy_id:
                     enemy_scan_panel.remove_scan_result(enemy_id)
                 game_state.combat.selected_enemy = None
@@ -704,7 +933,7 @@ try:
                 add_event_log("Enemy ship destroyed!")
                 # Safely remove enemy from system (may already be removed by splash damage)
                 if target_enemy in systems[current_system]:
-                    systems[current_system].remove(target_enemy)
+                    remove_system_object(systems, current_system, target_enemy)
                 if enemy_id:
                     enemy_scan_panel.remove_scan_result(enemy_id)
                 game_state.combat.selected_enemy = None
@@ -737,15 +966,15 @@ try:
                 
                 if enemy_id and enemy_id in enemy_scan_panel.scanned_enemies:
                     enemy_scan_panel.scanned_enemies[enemy_id]['hull'] = updated_result['target_health']
-                    enemy_scan_panel.scanned_enemies[enemy_id]['max_hull'] = getattr(enemy, 'max_health', constants.ENEMY_HULL_STRENGTH)
+                    enemy_scan_panel.scanned_enemies[enemy_id]['max_hull'] = enemy.max_health or constants.ENEMY_HULL_STRENGTH
                     enemy_scan_panel.scanned_enemies[enemy_id]['shields'] = updated_result['target_shields']
-                    enemy_scan_panel.scanned_enemies[enemy_id]['max_shields'] = getattr(enemy, 'max_shields', constants.ENEMY_SHIELD_CAPACITY)
+                    enemy_scan_panel.scanned_enemies[enemy_id]['max_shields'] = enemy.max_shields or constants.ENEMY_SHIELD_CAPACITY
                 
                 # Check if this enemy was destroyed
                 if updated_result.get('target_destroyed', False):
                     add_event_log(f"Enemy ship destroyed by {ring_name}!")
                     if enemy in systems[current_system]:
-                        systems[current_system].remove(enemy)
+                        remove_system_object(systems, current_system, enemy)
                     if enemy_id:
                         enemy_scan_panel.remove_scan_result(enemy_id)
                         if enemy_id in game_state.combat.targeted_enemies:
@@ -794,52 +1023,54 @@ try:
         # Draw stars in background (before hex grid) for system view
         if game_state.map_mode == 'system':
             # Draw stars that occupy 4 hexes - in background
-            for obj in systems.get(game_state.current_system, []):
-                if obj.type == 'star':
-                    if not hasattr(obj, 'system_q') or not hasattr(obj, 'system_r'):
-                        obj.system_q = random.randint(1, hex_grid.cols - 2)
-                        obj.system_r = random.randint(1, hex_grid.rows - 2)
-                    # Draw star across multiple hexes
-                    star_hexes = get_star_hexes(obj.system_q, obj.system_r)
-                    # Calculate center of mass for the star
-                    sum_x, sum_y = 0, 0
-                    valid_hexes = []
-                    for hq, hr in star_hexes:
-                        if 0 <= hq < hex_grid.cols and 0 <= hr < hex_grid.rows:
-                            hx, hy = hex_grid.get_hex_center(hq, hr)
-                            sum_x += hx
-                            sum_y += hy
-                            valid_hexes.append((hx, hy))
-                    if valid_hexes:
-                        center_x = sum_x / len(valid_hexes)
-                        center_y = sum_y / len(valid_hexes)
-                        # Get or assign star image
-                        if not hasattr(obj, 'star_image'):
-                            # Assign a random star image to this star object
-                            obj.star_image = background_and_star_loader.get_random_star_image()
-                            obj.scaled_star_image = None  # Will be scaled when needed
+            for obj in get_system_stars(game_state.current_system, systems):
+                if obj.system_q is None or obj.system_r is None:
+                    place_system_objects(game_state.current_system, systems, planet_orbits, hex_grid)
+                # Draw star across multiple hexes
+                star_hexes = get_star_hexes(obj.system_q, obj.system_r)
+                # Calculate center of mass for the star
+                sum_x, sum_y = 0, 0
+                valid_hexes = []
+                for hq, hr in star_hexes:
+                    if 0 <= hq < hex_grid.cols and 0 <= hr < hex_grid.rows:
+                        hx, hy = hex_grid.get_hex_center(hq, hr)
+                        sum_x += hx
+                        sum_y += hy
+                        valid_hexes.append((hx, hy))
+                if valid_hexes:
+                    center_x = sum_x / len(valid_hexes)
+                    center_y = sum_y / len(valid_hexes)
+                    # Get or assign star image
+                    if obj.star_image is None:
+                        # Assign a random star image to this star object
+                        obj.star_image = background_and_star_loader.get_random_star_image()
+                        obj.scaled_star_image = None  # Will be scaled when needed
                         
-                        # Draw star image if available, otherwise fallback to circle
-                        if obj.star_image:
-                            # Scale image if not already done or if radius changed
-                            if obj.scaled_star_image is None:
-                                obj.scaled_star_image = background_and_star_loader.scale_star_image(obj.star_image, hex_grid.radius * 4.5)
+                    # Draw star image if available, otherwise fallback to circle
+                    if obj.star_image:
+                        # Scale image if not already done or if radius changed
+                        if obj.scaled_star_image is None:
+                            obj.scaled_star_image = background_and_star_loader.scale_star_image(obj.star_image, hex_grid.radius * 4.5)
                             
-                            if obj.scaled_star_image:
-                                # Center the image
-                                image_rect = obj.scaled_star_image.get_rect()
-                                image_rect.center = (int(center_x), int(center_y))
-                                screen.blit(obj.scaled_star_image, image_rect)
-                            else:
-                                # Fallback to circle if image scaling failed
-                                if not hasattr(obj, 'color'):
-                                    obj.color = get_star_color()
-                                pygame.draw.circle(screen, obj.color, (int(center_x), int(center_y)), int(hex_grid.radius * 4.5))
+                        if obj.scaled_star_image:
+                            # Center the image
+                            image_rect = obj.scaled_star_image.get_rect()
+                            image_rect.center = (int(center_x), int(center_y))
+                            screen.blit(obj.scaled_star_image, image_rect)
                         else:
-                            # Fallback to circle if no image available
-                            if not hasattr(obj, 'color'):
+                            # Fallback to circle if image scaling failed
+                            if obj.color is None:
                                 obj.color = get_star_color()
-                            pygame.draw.circle(screen, obj.color, (int(center_x), int(center_y)), int(hex_grid.radius * 4.5))
+                            star_radius = int(hex_grid.radius * 4.5)
+                            screen.blit(get_circle_sprite(obj.color, star_radius),
+                                        (int(center_x) - star_radius, int(center_y) - star_radius))
+                    else:
+                        # Fallback to circle if no image available
+                        if obj.color is None:
+                            obj.color = get_star_color()
+                        star_radius = int(hex_grid.radius * 4.5)
+                        screen.blit(get_circle_sprite(obj.color, star_radius),
+                                    (int(center_x) - star_radius, int(center_y) - star_radius))
 
         # Draw the hex grid with conditional transparency based on map mode
         # Sector map: More visible for fog of war navigation, System map: Barely visible for clean aesthetics
@@ -852,81 +1083,15 @@ try:
         # --- FOG OF WAR OVERLAY (draw early to hide objects) ---
         # Only apply fog of war to sector map, not system maps
         if game_state.map_mode == 'sector':
-            for row in range(hex_grid.rows):
-                for col in range(hex_grid.cols):
-                    if (col, row) not in game_state.scan.scanned_systems:
-                        cx, cy = hex_grid.get_hex_center(col, row)
-                        hex_grid.draw_fog_hex(screen, cx, cy, color=(200, 200, 200), alpha=25)
-
-        # Calculate delta time for smooth ship rotation
-        delta_time = clock.get_time() / 1000.0  # Convert milliseconds to seconds
+            hex_grid.draw_fog(screen, game_state.scan.scanned_systems, color=(200, 200, 200), alpha=25)
 
         # Draw objects on the grid
         if game_state.map_mode == 'sector':
             # Only draw system indicators if a sector scan has been done
             if game_state.scan.sector_scan_active:
-                # Show indicator for any hex that has actual systems (not individual planets)
-                # Stars have systems, lazy objects have systems, but planets orbit around stars elsewhere
-                occupied_hexes = set(star_coords)
-                for coords_set in lazy_object_coords.values():
-                    occupied_hexes.update(coords_set)
-                
-                # Ensure starbase systems are generated for sector map display
-                if 'starbase' in lazy_object_coords:
-                    for starbase_coord in lazy_object_coords['starbase']:
-                        if starbase_coord not in systems:
-                            # Generate the missing starbase system
-                            from galaxy_generation.object_placement import generate_system_objects
-                            starbase_objects = generate_system_objects(
-                                starbase_coord[0], starbase_coord[1],
-                                lazy_object_coords,
-                                star_coords=star_coords,
-                                planet_orbits=planet_orbits,
-                                grid_size=hex_grid.cols
-                            )
-                            systems[starbase_coord] = starbase_objects
-
-                # Ensure anomaly systems are generated for sector map display (for testing)
-                if 'anomaly' in lazy_object_coords:
-                    for anomaly_coord in lazy_object_coords['anomaly']:
-                        if anomaly_coord not in systems:
-                            # Generate the missing anomaly system
-                            from galaxy_generation.object_placement import generate_system_objects
-                            anomaly_objects = generate_system_objects(
-                                anomaly_coord[0], anomaly_coord[1],
-                                lazy_object_coords,
-                                star_coords=star_coords,
-                                planet_orbits=planet_orbits,
-                                grid_size=hex_grid.cols
-                            )
-                            systems[anomaly_coord] = anomaly_objects
-
-                # NOTE: Don't add planet coordinates - they orbit around stars, they don't have their own systems
-                green_dots_drawn = 0
-                for q, r in occupied_hexes:
-                    px, py = hex_grid.get_hex_center(q, r)
-                    
-                    # Check if this system contains a starbase or anomaly
-                    system_has_starbase = False
-                    system_has_anomaly = False
-                    system_objects = systems.get((q, r), [])
-                    for obj in system_objects:
-                        if obj.type == 'starbase':
-                            system_has_starbase = True
-                        elif obj.type == 'anomaly':
-                            system_has_anomaly = True
-
-                    # Draw dot with appropriate color
-                    # Light green for starbase, purple/magenta for anomaly, default gray for others
-                    if system_has_starbase:
-                        dot_color = (144, 238, 144)  # Light green
-                    elif system_has_anomaly:
-                        dot_color = (180, 0, 255)  # Purple/magenta for anomalies
-                    else:
-                        dot_color = (100, 100, 130)  # Default gray
-                    pygame.draw.circle(
-                        screen, dot_color, (int(px), int(py)), 6
-                    )
+                if sector_indicator_blits is None:
+                    sector_indicator_blits = build_sector_indicator_blits()
+                screen.blits(sector_indicator_blits, doreturn=False)
         else:
             # Ensure we have objects for the current system (generate but don't show until scanned)
             if current_system not in systems:
@@ -935,7 +1100,7 @@ try:
                 expected_romulans = lazy_object_coords.get('romulan', []).count(current_system)
                 expected_enemies = expected_klingons + expected_romulans
                 is_star = current_system in star_coords
-                has_planets = any(orbit['star'] == current_system for orbit in planet_orbits)
+                has_planets = bool(get_system_planet_orbits(current_system, planet_orbits, hex_grid))
                 add_event_log(f"[RENDER GEN] Generating system {current_system}")
                 add_event_log(f"[RENDER GEN] Type: {'STAR+PLANET' if is_star and has_planets else 'STAR' if is_star else 'EMPTY'}")
                 add_event_log(f"[RENDER GEN] Expected enemies: {expected_enemies} ({expected_klingons} Klingon, {expected_romulans} Romulan)")
@@ -963,68 +1128,15 @@ try:
                     planet_orbits=planet_orbits,
                     grid_size=hex_grid.cols
                 )
-                # Assign random system positions to all objects, avoiding collisions
-                placed_objects = []
-                for obj in system_objs:
-                    if obj.type == 'star':
-                        # Stars need more space, place them away from edges
-                        obj.system_q = random.randint(2, hex_grid.cols - 3)
-                        obj.system_r = random.randint(2, hex_grid.rows - 3)
-                        placed_objects.append(obj)
-                    else:
-                        # For other objects, find unblocked positions
-                        max_attempts = 50
-                        placed = False
-                        for _ in range(max_attempts):
-                            q = random.randint(0, hex_grid.cols - 1)
-                            r = random.randint(0, hex_grid.rows - 1)
-                            # Check if blocked by previously placed objects
-                            blocked = False
-                            for placed_obj in placed_objects:
-                                if placed_obj.type == 'star':
-                                    star_hexes = get_star_hexes(placed_obj.system_q, placed_obj.system_r)
-                                    if (q, r) in star_hexes:
-                                        blocked = True
-                                        break
-                                elif hasattr(placed_obj, 'system_q') and placed_obj.system_q == q and placed_obj.system_r == r:
-                                    blocked = True
-                                    break
-                            if not blocked:
-                                obj.system_q = q
-                                obj.system_r = r
-                                placed_objects.append(obj)
-                                placed = True
-                                break
-                        if not placed:
-                            # Fallback: find any free hex
-                            for q in range(hex_grid.cols):
-                                for r in range(hex_grid.rows):
-                                    blocked = False
-                                    for placed_obj in placed_objects:
-                                        if placed_obj.type == 'star':
-                                            star_hexes = get_star_hexes(placed_obj.system_q, placed_obj.system_r)
-                                            if (q, r) in star_hexes:
-                                                blocked = True
-                                                break
-                                        elif hasattr(placed_obj, 'system_q') and placed_obj.system_q == q and placed_obj.system_r == r:
-                                            blocked = True
-                                            break
-                                    if not blocked:
-                                        obj.system_q = q
-                                        obj.system_r = r
-                                        placed_objects.append(obj)
-                                        placed = True
-                                        break
-                                if placed:
-                                    break
                 systems[current_system] = system_objs
+                # Positions are assigned once here; the render loop only reads them
+                place_system_objects(current_system, systems, planet_orbits, hex_grid)
+                game_state.record_system_objects(current_system, system_objs)
                 logging.info(f"[RENDER] Generated {len(system_objs)} objects for system {current_system}")
                 
                 # Debug: Show what was generated (one-time only)
                 add_event_log(f"[RENDER GEN] Generated {len(system_objs)} objects")
-                obj_counts = {}
-                for obj in system_objs:
-                    obj_counts[obj.type] = obj_counts.get(obj.type, 0) + 1
+                obj_counts = Counter(obj.type for obj in system_objs)
                 add_event_log(f"[RENDER GEN] Objects: {dict(obj_counts)}")
                 
                 # Check for missing enemies
@@ -1036,100 +1148,56 @@ try:
             # Note: Stars are now drawn in background before hex grid
                 
             # Animate and draw all planets associated with stars in this system
-            planets_in_system = [orbit for orbit in planet_orbits if orbit['star'] == current_system]
-            if last_debug_system != current_system:
+            system_orbits = get_system_planet_orbits(current_system, planet_orbits, hex_grid)
+            if DEBUG_RENDER and last_debug_system != current_system:
                 last_debug_system = current_system
+                logging.debug("[PLANETS] System %s has %d planets", current_system, len(system_orbits))
             
-            for orbit in planets_in_system:
-                # Get star position in system coordinates
-                star_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'star'), None)
-                if star_obj and hasattr(star_obj, 'system_q') and hasattr(star_obj, 'system_r'):
-                    star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
-                else:
+            # Get star position in system coordinates (once per frame, not per planet)
+            if system_orbits:
+                star_obj, star_center = get_system_star(current_system, systems, hex_grid)
+                if star_center is None:
                     # This shouldn't happen - log error
                     print(f"[ERROR] No star object found in system {current_system} for planet orbit!")
-                    star_px, star_py = hex_grid.get_hex_center(current_system[0], current_system[1])
-                
-                hex_size = hex_grid.hex_size if hasattr(hex_grid, 'hex_size') else 20
-                # Use full orbital radius without reduction to maintain proper separation
-                orbit_radius_px = orbit['hex_radius'] * hex_size
-                key = (orbit['star'], orbit['planet'])
-                # Convert milliseconds to seconds for smooth animation
-                dt = clock.get_time() / 1000.0
-                # Update angle based on speed (radians per second)
-                planet_anim_state[key] += orbit['speed'] * dt
-                angle = planet_anim_state[key]
+                    star_center = hex_grid.get_hex_center(current_system[0], current_system[1])
+                star_px, star_py = star_center
+
+            # Advance every orbit by this frame's fixed ticks in one pass (speed is
+            # in radians per second); frames between ticks skip the update entirely
+            if sim_steps:
+                sim_time = sim_steps * SIM_DT
+                for key, orbit, _ in system_orbits:
+                    planet_anim_state[key] += orbit['speed'] * sim_time
+
+            # Draw at the full orbital radius to maintain proper separation
+            planet_blits = []
+            for key, orbit, orbit_radius_px in system_orbits:
+                angle = interpolate_orbit_angle(planet_anim_state[key], orbit['speed'])
                 planet_px = star_px + orbit_radius_px * math.cos(angle)
                 planet_py = star_py + orbit_radius_px * math.sin(angle)
-                
+                planet_positions[key] = (planet_px, planet_py)
                 # Draw planet at exact orbital position (no hex snapping)
-                planet_key = (orbit['star'], orbit['planet'])
-                
-                # Get or assign planet image and size for maximum variety
-                if planet_key not in planet_images_assigned:
-                    # Assign a random planet image for maximum variety
-                    planet_image = background_and_star_loader.get_random_planet_image()
-                    # Assign random size: 1.0 (minimum/current size) to 3.3 (roughly 2 hex widths)
-                    size_multiplier = random.uniform(1.0, 3.3)
-                    scaled_planet_image = None
-                    if planet_image:
-                        scaled_planet_image = background_and_star_loader.scale_planet_image(
-                            planet_image, hex_grid.radius * 1.8, size_multiplier
-                        )
-                    planet_images_assigned[planet_key] = (planet_image, scaled_planet_image, size_multiplier)
-                    logging.debug(f"[PLANETS] Assigned random planet image to {planet_key} with size multiplier {size_multiplier:.2f}")
-                else:
-                    planet_image, scaled_planet_image, size_multiplier = planet_images_assigned[planet_key]
-                
-                # Draw planet image if available, otherwise fallback to circle
-                if scaled_planet_image:
-                    # Center the planet image
-                    image_rect = scaled_planet_image.get_rect()
-                    image_rect.center = (int(planet_px), int(planet_py))
-                    screen.blit(scaled_planet_image, image_rect)
-                else:
-                    # Fallback to circle if no image available
-                    if planet_key not in planet_colors:
-                        planet_colors[planet_key] = get_planet_color()
-                    planet_color = planet_colors[planet_key]
-                    # Use the same variable sizing for consistency
-                    base_radius = hex_grid.radius * 1.8 * 0.6  # Base size
-                    variable_radius = int(base_radius * size_multiplier)
-                    pygame.draw.circle(screen, planet_color, (int(planet_px), int(planet_py)), variable_radius)
+                sprite = planet_sprites.get(key)
+                if sprite is None:
+                    sprite = planet_sprites[key] = build_planet_sprite(key)
+                planet_surface, half_w, half_h = sprite
+                planet_blits.append((planet_surface, (int(planet_px) - half_w, int(planet_py) - half_h)))
+            screen.blits(planet_blits, doreturn=False)
             
-            # Draw other objects (starbase, enemy, anomaly, player) with system positions
+            # Draw other objects (starbase, enemy, anomaly, player) with system positions.
+            # Values that are the same for every object are looked up once per frame.
+            enemy_ships = player_ship.combat_manager.enemy_ships if hasattr(player_ship, 'combat_manager') else {}
+            player_at_anim_pos = ((game_state.orbital.player_orbiting_planet or system_ship_moving)
+                                  and system_ship_anim_x is not None and system_ship_anim_y is not None)
+            # Every object is a single blit, so they are queued and drawn with one blits() call
+            object_blits = []
             for obj in systems.get(current_system, []):
                     if obj.type != 'star':
-                        if not hasattr(obj, 'system_q') or not hasattr(obj, 'system_r'):
-                            # Find unblocked position for this object
-                            max_attempts = 50
-                            placed = False
-                            for _ in range(max_attempts):
-                                q = random.randint(0, hex_grid.cols - 1)
-                                r = random.randint(0, hex_grid.rows - 1)
-                                blocked, _ = is_hex_blocked(q, r, current_system, systems, planet_orbits, hex_grid)
-                                # Also check if another object is already there
-                                occupied = any(o != obj and hasattr(o, 'system_q') and o.system_q == q and hasattr(o, 'system_r') and o.system_r == r 
-                                             for o in systems.get(current_system, []))
-                                if not blocked and not occupied:
-                                    obj.system_q = q
-                                    obj.system_r = r
-                                    placed = True
-                                    break
-                            if not placed:
-                                # Fallback: place at first available hex
-                                for q in range(hex_grid.cols):
-                                    for r in range(hex_grid.rows):
-                                        blocked, _ = is_hex_blocked(q, r, current_system, systems, planet_orbits, hex_grid)
-                                        occupied = any(o != obj and hasattr(o, 'system_q') and o.system_q == q and hasattr(o, 'system_r') and o.system_r == r 
-                                                     for o in systems.get(current_system, []))
-                                        if not blocked and not occupied:
-                                            obj.system_q = q
-                                            obj.system_r = r
-                                            placed = True
-                                            break
-                                    if placed:
-                                        break
+                        if obj.system_q is None or obj.system_r is None:
+                            # Objects added after generation are placed on first sight
+                            place_system_objects(current_system, systems, planet_orbits, hex_grid)
+                            if obj.system_q is None or obj.system_r is None:
+                                continue
                         px, py = hex_grid.get_hex_center(obj.system_q, obj.system_r)
                         if obj.type == 'starbase':
                             # Use starbase image if available, otherwise fallback to rectangle
@@ -1139,28 +1207,26 @@ try:
                                 if scaled_starbase:
                                     # Center the image on the hex
                                     img_rect = scaled_starbase.get_rect(center=(int(px), int(py)))
-                                    screen.blit(scaled_starbase, img_rect)
+                                    object_blits.append((scaled_starbase, img_rect))
                                 else:
                                     # Fallback to rectangle if scaling fails
-                                    color = (0, 0, 255)
-                                    pygame.draw.rect(screen, color, (int(px)-6, int(py)-6, 12, 12))
+                                    object_blits.append(fallback_sprite_blit('starbase', px, py))
                             else:
                                 # Fallback to rectangle if image not available
-                                color = (0, 0, 255)
-                                pygame.draw.rect(screen, color, (int(px)-6, int(py)-6, 12, 12))
+                                object_blits.append(fallback_sprite_blit('starbase', px, py))
                         elif obj.type == 'enemy':
                             # Get current position from dynamic EnemyShip AI or static position
                             render_px, render_py = get_enemy_current_position(obj, hex_grid)
 
                             # Get faction from enemy object (defaults to klingon)
-                            enemy_faction = getattr(obj, 'faction', None) or 'klingon'
+                            enemy_faction = obj.faction or 'klingon'
 
                             # Check if this is a cloaked Romulan ship
                             enemy_id = id(obj)
                             is_cloaked = False
                             is_flashing = False
-                            if hasattr(player_ship, 'combat_manager') and enemy_id in player_ship.combat_manager.enemy_ships:
-                                enemy_ship = player_ship.combat_manager.enemy_ships[enemy_id]
+                            enemy_ship = enemy_ships.get(enemy_id)
+                            if enemy_ship is not None:
                                 is_cloaked = getattr(enemy_ship, 'is_cloaked', False)
                                 is_flashing = getattr(enemy_ship, '_is_flashing', False)
                                 # Check is_visible property for rendering decision
@@ -1174,25 +1240,23 @@ try:
                                 scaled_enemy = background_and_star_loader.scale_ship_image(enemy_img, hex_grid.radius, faction=enemy_faction)
                                 if scaled_enemy:
                                     # Initialize rotation tracking if not exists
-                                    if not hasattr(obj, 'current_rotation'):
+                                    if obj.current_rotation is None:
                                         obj.current_rotation = 0.0
                                     
                                     # Calculate target rotation based on movement direction
                                     # Only update target rotation when movement starts or changes
-                                    if not hasattr(obj, 'target_rotation'):
+                                    if obj.target_rotation is None:
                                         obj.target_rotation = obj.current_rotation
                                     
                                     # Check if this enemy has an AI ship that's moving
-                                    enemy_id = id(obj)
-                                    if hasattr(player_ship, 'combat_manager') and enemy_id in player_ship.combat_manager.enemy_ships:
-                                        enemy_ship = player_ship.combat_manager.enemy_ships[enemy_id]
+                                    if enemy_ship is not None:
                                         if enemy_ship.is_moving and enemy_ship.target_position:
                                             # Enemy is moving - calculate rotation based on current position to final destination
                                             current_pos = (render_px, render_py)
                                             dest_pos = hex_grid.get_hex_center(enemy_ship.target_position[0], enemy_ship.target_position[1])
                                             new_target_rotation = background_and_star_loader.calculate_movement_angle(current_pos, dest_pos)
                                             obj.target_rotation = new_target_rotation
-                                        elif hasattr(obj, 'prev_render_px') and hasattr(obj, 'prev_render_py'):
+                                        elif obj.prev_render_px is not None and obj.prev_render_py is not None:
                                             # Use previous position to calculate movement direction for smooth transitions
                                             prev_pos = (obj.prev_render_px, obj.prev_render_py)
                                             current_pos = (render_px, render_py)
@@ -1204,7 +1268,7 @@ try:
                                                     obj.target_rotation = background_and_star_loader.calculate_movement_angle(prev_pos, current_pos)
                                     else:
                                         # Fallback: if no AI ship found, use position-based rotation
-                                        if hasattr(obj, 'prev_render_px') and hasattr(obj, 'prev_render_py'):
+                                        if obj.prev_render_px is not None and obj.prev_render_py is not None:
                                             prev_pos = (obj.prev_render_px, obj.prev_render_py)
                                             current_pos = (render_px, render_py)
                                             if prev_pos != current_pos:
@@ -1244,30 +1308,20 @@ try:
                                         else:
                                             flash_surface.set_alpha(128)  # Semi-transparent
                                         img_rect = flash_surface.get_rect(center=(int(render_px), int(render_py)))
-                                        screen.blit(flash_surface, img_rect)
+                                        object_blits.append((flash_surface, img_rect))
                                     else:
                                         img_rect = rotated_enemy.get_rect(center=(int(render_px), int(render_py)))
-                                        screen.blit(rotated_enemy, img_rect)
+                                        object_blits.append((rotated_enemy, img_rect))
                                 else:
                                     # Fallback to triangle if scaling fails
                                     # Romulans are green, Klingons are red
-                                    color = (0, 200, 0) if enemy_faction == 'romulan' else (255, 0, 0)
-                                    size = 12 if enemy_faction == 'romulan' else 8  # Romulans larger
-                                    pygame.draw.polygon(screen, color, [
-                                        (int(render_px), int(render_py)-size),
-                                        (int(render_px)-int(size*0.75), int(render_py)+int(size*0.5)),
-                                        (int(render_px)+int(size*0.75), int(render_py)+int(size*0.5))
-                                    ])
+                                    object_blits.append(fallback_sprite_blit(
+                                        'enemy_romulan' if enemy_faction == 'romulan' else 'enemy_klingon', render_px, render_py))
                             else:
                                 # Fallback to triangle if image not available
                                 # Romulans are green, Klingons are red
-                                color = (0, 200, 0) if enemy_faction == 'romulan' else (255, 0, 0)
-                                size = 12 if enemy_faction == 'romulan' else 8  # Romulans larger
-                                pygame.draw.polygon(screen, color, [
-                                    (int(render_px), int(render_py)-size),
-                                    (int(render_px)-int(size*0.75), int(render_py)+int(size*0.5)),
-                                    (int(render_px)+int(size*0.75), int(render_py)+int(size*0.5))
-                                ])
+                                object_blits.append(fallback_sprite_blit(
+                                    'enemy_romulan' if enemy_faction == 'romulan' else 'enemy_klingon', render_px, render_py))
                         elif obj.type == 'anomaly':
                             # Get anomaly type from props, or use a random one
                             anomaly_type = obj.props.get('anomaly_type', None)
@@ -1284,12 +1338,14 @@ try:
                                 if scaled_anomaly:
                                     # Center the image on the hex position
                                     img_rect = scaled_anomaly.get_rect(center=(int(px), int(py)))
-                                    screen.blit(scaled_anomaly, img_rect)
+                                    object_blits.append((scaled_anomaly, img_rect))
                             else:
                                 # Fallback to magenta circle if image not available
                                 # Match the scaled anomaly size (2x star size)
                                 color = (255, 0, 255)
-                                pygame.draw.circle(screen, color, (int(px), int(py)), int(hex_grid.radius * 4.5 * 2))
+                                anomaly_radius = int(hex_grid.radius * 4.5 * 2)
+                                object_blits.append((get_circle_sprite(color, anomaly_radius),
+                                                     (int(px) - anomaly_radius, int(py) - anomaly_radius)))
                         elif obj.type == 'player':
                             # Only draw player ship if it's not destroyed
                             if hasattr(player_ship, 'ship_state') and player_ship.ship_state == "destroyed":
@@ -1302,19 +1358,19 @@ try:
                                 scaled_player = background_and_star_loader.scale_ship_image(player_img, hex_grid.radius)
                                 if scaled_player:
                                     # Initialize rotation tracking if not exists
-                                    if not hasattr(obj, 'current_rotation'):
+                                    if obj.current_rotation is None:
                                         obj.current_rotation = 0.0
                                     
                                     # Calculate target rotation based on movement direction
                                     # Only update target rotation when movement starts or changes
-                                    if not hasattr(obj, 'target_rotation'):
+                                    if obj.target_rotation is None:
                                         obj.target_rotation = obj.current_rotation
                                     
-                                    if (game_state.orbital.player_orbiting_planet or system_ship_moving) and system_ship_anim_x is not None and system_ship_anim_y is not None:
+                                    if player_at_anim_pos:
                                         # Ship is animated - calculate target rotation
                                         if system_ship_moving and system_dest_q is not None and system_dest_r is not None:
                                             # Moving to destination - only update target rotation when destination changes
-                                            if not hasattr(obj, 'last_system_dest_q') or obj.last_system_dest_q != system_dest_q or obj.last_system_dest_r != system_dest_r:
+                                            if obj.last_system_dest_q is None or obj.last_system_dest_q != system_dest_q or obj.last_system_dest_r != system_dest_r:
                                                 current_pos = (system_ship_anim_x, system_ship_anim_y)
                                                 dest_pos = hex_grid.get_hex_center(system_dest_q, system_dest_r)
                                                 obj.target_rotation = background_and_star_loader.calculate_movement_angle(current_pos, dest_pos)
@@ -1323,7 +1379,7 @@ try:
                                         elif game_state.orbital.player_orbiting_planet:
                                             # Orbiting - calculate rotation based on orbital movement (continuous for smooth orbital rotation)
                                             # Use previous position to calculate movement direction
-                                            if hasattr(obj, 'prev_anim_x') and hasattr(obj, 'prev_anim_y'):
+                                            if obj.prev_anim_x is not None and obj.prev_anim_y is not None:
                                                 prev_pos = (obj.prev_anim_x, obj.prev_anim_y)
                                                 current_pos = (system_ship_anim_x, system_ship_anim_y)
                                                 obj.target_rotation = background_and_star_loader.calculate_movement_angle(prev_pos, current_pos)
@@ -1346,28 +1402,27 @@ try:
                                     # Apply rotation
                                     rotated_player = background_and_star_loader.rotate_ship_image(scaled_player, obj.current_rotation)
                                     
-                                    if (game_state.orbital.player_orbiting_planet or system_ship_moving) and system_ship_anim_x is not None and system_ship_anim_y is not None:
+                                    if player_at_anim_pos:
                                         # Use animated position
                                         img_rect = rotated_player.get_rect(center=(int(system_ship_anim_x), int(system_ship_anim_y)))
-                                        screen.blit(rotated_player, img_rect)
+                                        object_blits.append((rotated_player, img_rect))
                                     else:
                                         # Use static position
                                         img_rect = rotated_player.get_rect(center=(int(px), int(py)))
-                                        screen.blit(rotated_player, img_rect)
+                                        object_blits.append((rotated_player, img_rect))
                                 else:
                                     # Fallback to circle if scaling fails
-                                    color = (0, 255, 255)
-                                    if (game_state.orbital.player_orbiting_planet or system_ship_moving) and system_ship_anim_x is not None and system_ship_anim_y is not None:
-                                        pygame.draw.circle(screen, color, (int(system_ship_anim_x), int(system_ship_anim_y)), 8)
+                                    if player_at_anim_pos:
+                                        object_blits.append(fallback_sprite_blit('player', system_ship_anim_x, system_ship_anim_y))
                                     else:
-                                        pygame.draw.circle(screen, color, (int(px), int(py)), 8)
+                                        object_blits.append(fallback_sprite_blit('player', px, py))
                             else:
                                 # Fallback to circle if image not available
-                                color = (0, 255, 255)
-                                if (game_state.orbital.player_orbiting_planet or system_ship_moving) and system_ship_anim_x is not None and system_ship_anim_y is not None:
-                                    pygame.draw.circle(screen, color, (int(system_ship_anim_x), int(system_ship_anim_y)), 8)
+                                if player_at_anim_pos:
+                                    object_blits.append(fallback_sprite_blit('player', system_ship_anim_x, system_ship_anim_y))
                                 else:
-                                    pygame.draw.circle(screen, color, (int(px), int(py)), 8)
+                                    object_blits.append(fallback_sprite_blit('player', px, py))
+            screen.blits(object_blits, doreturn=False)
 
         # Draw player ship
         if game_state.map_mode == 'sector':
@@ -1457,6 +1512,7 @@ try:
         # Toggle button is available
 
         # Update event context with current state each frame
+        event_ctx.current_time = current_time
         event_ctx.current_system = current_system
         event_ctx.ship_q = ship_q
         event_ctx.ship_r = ship_r
@@ -1483,12 +1539,14 @@ try:
                 )
                 if clicked_index is not None:
                     label = button_labels[clicked_index] if clicked_index < len(button_labels) else str(clicked_index)
-                    print(f"[DEBUG] Button {clicked_index} clicked: {label}")
+                    if DEBUG_UI:
+                        print(f"[DEBUG] Button {clicked_index} clicked: {label}")
                     # Use event handler module for button clicks
                     handle_button_click(label, event_ctx)
 
                 if toggle_clicked:
-                    print("Toggle button clicked")
+                    if DEBUG_UI:
+                        print("Toggle button clicked")
                     handle_toggle_click(event_ctx)
 
             # Handle ship status display clicks first
@@ -1544,8 +1602,7 @@ try:
 
         # Update ship position (delta time based)
         if game_state.animation.ship_moving and game_state.animation.dest_q is not None and game_state.animation.dest_r is not None:
-            now = pygame.time.get_ticks()
-            elapsed = now - game_state.animation.move_start_time if game_state.animation.move_start_time is not None else 0
+            elapsed = current_time - game_state.animation.move_start_time if game_state.animation.move_start_time is not None else 0
             # Use trajectory start position if available, otherwise fall back to ship hex position
             if trajectory_start_x is not None and trajectory_start_y is not None:
                 start_x, start_y = trajectory_start_x, trajectory_start_y
@@ -1607,10 +1664,7 @@ try:
                 logging.info(f"[MOVE] Ship arrived at ({ship_q}, {ship_r})")
                 add_event_log(f"Arrived at sector ({ship_q}, {ship_r}) - Energy: {int(player_ship.warp_core_energy)}/{int(player_ship.max_warp_core_energy)}")
                 # Check if there's a system here (star or any lazy object, but not individual planets)
-                system_here = (
-                    (ship_q, ship_r) in star_coords or
-                    any((ship_q, ship_r) in coords_set for coords_set in lazy_object_coords.values())
-                )
+                system_here = (ship_q, ship_r) in all_system_coords
                 logging.info(f"[MOVE] Entering coordinate ({ship_q}, {ship_r})")
                 if system_here:
                     add_event_log(f"Entered system at ({ship_q}, {ship_r})")
@@ -1675,17 +1729,9 @@ try:
                         grid_size=hex_grid.cols
                     )
                     systems[current_system] = system_objs
+                    place_system_objects(current_system, systems, planet_orbits, hex_grid)
                     log_debug(f"[WIREFRAME] generate_system_objects returned {len(system_objs)} objects")
-                    game_state.system_object_states[current_system] = [
-                        {
-                            'type': obj.type,
-                            'q': obj.q,
-                            'r': obj.r,
-                            'system_q': getattr(obj, 'system_q', None),
-                            'system_r': getattr(obj, 'system_r', None),
-                            'props': obj.props
-                        } for obj in system_objs
-                    ]
+                    game_state.record_system_objects(current_system, system_objs)
                     if system_objs:
                         logging.info(f"[MOVE] Generated {len(system_objs)} objects for system {current_system}")
                     else:
@@ -1693,45 +1739,16 @@ try:
                 else:
                     logging.info(f"[MOVE] Using existing objects for system {current_system}")
                 # --- Ensure player object exists and is placed at a random, unoccupied hex ---
-                player_obj = next((obj for obj in systems[current_system] if obj.type == 'player'), None)
+                player_obj = find_system_player(systems, current_system)
                 if player_obj is None:
-                    # Find all occupied hexes in system
-                    occupied = set((getattr(obj, 'system_q', None), getattr(obj, 'system_r', None))
-                                   for obj in systems[current_system] if hasattr(obj, 'system_q') and hasattr(obj, 'system_r'))
-                    # Try random positions until an unoccupied one is found
-                    max_attempts = 100
-                    for _ in range(max_attempts):
-                        rand_q = random.randint(0, hex_grid.cols - 1)
-                        rand_r = random.randint(0, hex_grid.rows - 1)
-                        if (rand_q, rand_r) not in occupied:
-                            player_obj = MapObject('player', ship_q, ship_r)
-                            player_obj.system_q = rand_q
-                            player_obj.system_r = rand_r
-                            systems[current_system].append(player_obj)
-                            break
-                    else:
-                        # Fallback: just add at (0,0)
-                        player_obj = MapObject('player', ship_q, ship_r)
-                        player_obj.system_q = 0
-                        player_obj.system_r = 0
-                        systems[current_system].append(player_obj)
-                else:
-                    # If player_obj exists but has no system_q/system_r, assign it
-                    if not hasattr(player_obj, 'system_q') or not hasattr(player_obj, 'system_r'):
-                        occupied = set((getattr(obj, 'system_q', None), getattr(obj, 'system_r', None))
-                                       for obj in systems[current_system] if hasattr(obj, 'system_q') and hasattr(obj, 'system_r'))
-                        max_attempts = 100
-                        for _ in range(max_attempts):
-                            rand_q = random.randint(0, hex_grid.cols - 1)
-                            rand_r = random.randint(0, hex_grid.rows - 1)
-                            if (rand_q, rand_r) not in occupied:
-                                player_obj.system_q = rand_q
-                                player_obj.system_r = rand_r
-                                break
-                        else:
-                            player_obj.system_q = 0
-                            player_obj.system_r = 0
-                
+                    player_obj = MapObject('player', ship_q, ship_r)
+                    add_system_object(systems, current_system, player_obj)
+                if player_obj.system_q is None or player_obj.system_r is None:
+                    # One pass over the system's objects gives the free hexes; (0,0) if there are none
+                    place_system_objects(current_system, systems, planet_orbits, hex_grid)
+                    if player_obj.system_q is None or player_obj.system_r is None:
+                        player_obj.system_q, player_obj.system_r = 0, 0
+
                 # Update weapon animation manager with current system objects immediately
                 # This ensures torpedo splash damage works even before manual scan
                 if game_state.weapon_animation_manager:
@@ -1743,7 +1760,7 @@ try:
                 
                 # First check system type
                 is_star_system = current_system in star_coords
-                has_planets = any(orbit['star'] == current_system for orbit in planet_orbits)
+                has_planets = bool(get_system_planet_orbits(current_system, planet_orbits, hex_grid))
                 system_type = "EMPTY"
                 if is_star_system and has_planets:
                     system_type = "STAR+PLANET"
@@ -1763,14 +1780,11 @@ try:
                     game_state.weapon_animation_manager.system_objects = system_objects
                 
                 # Update enemy AI through combat manager (after all system objects are generated)
-                delta_time = clock.get_time() / 1000.0  # Convert milliseconds to seconds
                 player_ship.combat_manager.update_enemy_ai(delta_time, systems, game_state.current_system, hex_grid, player_ship)
                 
                 # Show detailed object information
                 add_event_log(f"[SCAN] System contains {len(system_objects)} objects:")
-                obj_summary = {}
-                for obj in system_objects:
-                    obj_summary[obj.type] = obj_summary.get(obj.type, 0) + 1
+                obj_summary = Counter(obj.type for obj in system_objects)
                 
                 # List each object type and count
                 for obj_type, count in sorted(obj_summary.items()):
@@ -1783,7 +1797,7 @@ try:
                     add_event_log(f"[ENEMIES] {len(enemy_objects)} enemy ships detected:")
                     log_debug(f"[WIREFRAME] Found {len(enemy_objects)} enemy objects in system")
                     for i, enemy in enumerate(enemy_objects):
-                        pos_info = f"({enemy.system_q}, {enemy.system_r})" if hasattr(enemy, 'system_q') else "NO POS"
+                        pos_info = f"({enemy.system_q}, {enemy.system_r})" if enemy.system_q is not None else "NO POS"
                         add_event_log(f"  Enemy {i+1} at system pos {pos_info}")
                         log_debug(f"[WIREFRAME] Enemy {i+1}: {pos_info}")
                 else:
@@ -1800,37 +1814,25 @@ try:
         # Update player ship position (orbital or linear movement)
         if game_state.map_mode == 'system':
             if game_state.orbital.player_orbiting_planet and game_state.orbital.player_orbit_center is not None:
-                # Update orbital animation
-                dt = clock.get_time() / 1000.0
-                game_state.orbital.orbital_angle += game_state.orbital.orbital_speed * dt
+                # Update orbital animation in fixed ticks
+                game_state.orbital.orbital_angle += game_state.orbital.orbital_speed * sim_steps * SIM_DT
                 
                 # Update the planet's position (since planets orbit stars)
-                # Find the specific planet that the player is orbiting using the stored key
-                if player_orbit_key is not None:
-                    target_orbit = next((orbit for orbit in planet_orbits if (orbit['star'], orbit['planet']) == player_orbit_key), None)
-                    if target_orbit:
-                        star_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'star'), None)
-                        if star_obj and hasattr(star_obj, 'system_q') and hasattr(star_obj, 'system_r'):
-                            star_px, star_py = hex_grid.get_hex_center(star_obj.system_q, star_obj.system_r)
-                            hex_size = hex_grid.hex_size if hasattr(hex_grid, 'hex_size') else 20
-                            orbit_radius_px = target_orbit['hex_radius'] * hex_size
-                            angle = planet_anim_state.get(player_orbit_key, target_orbit['angle'])
-                            planet_px = star_px + orbit_radius_px * math.cos(angle)
-                            planet_py = star_py + orbit_radius_px * math.sin(angle)
-                            
-                            # Update the orbit center to follow the planet
-                            game_state.orbital.player_orbit_center = (planet_px, planet_py)
+                # Follow the planet the player is orbiting to where it was drawn this frame
+                planet_position = planet_positions.get(player_orbit_key)
+                if planet_position is not None:
+                    game_state.orbital.player_orbit_center = planet_position
                 
                 # Calculate player ship position in orbit around planet
-                system_ship_anim_x = game_state.orbital.player_orbit_center[0] + game_state.orbital.orbital_radius * math.cos(game_state.orbital.orbital_angle)
-                system_ship_anim_y = game_state.orbital.player_orbit_center[1] + game_state.orbital.orbital_radius * math.sin(game_state.orbital.orbital_angle)
+                ship_orbit_angle = interpolate_orbit_angle(game_state.orbital.orbital_angle, game_state.orbital.orbital_speed)
+                system_ship_anim_x = game_state.orbital.player_orbit_center[0] + game_state.orbital.orbital_radius * math.cos(ship_orbit_angle)
+                system_ship_anim_y = game_state.orbital.player_orbit_center[1] + game_state.orbital.orbital_radius * math.sin(ship_orbit_angle)
                 
             elif system_ship_moving and system_dest_q is not None and system_dest_r is not None:
                 # Regular movement animation
-                player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+                player_obj = find_system_player(systems, current_system)
                 if player_obj is not None:
-                    now = pygame.time.get_ticks()
-                    elapsed = now - system_move_start_time if system_move_start_time is not None else 0
+                    elapsed = current_time - system_move_start_time if system_move_start_time is not None else 0
                     # Use system trajectory start position if available, otherwise fall back to player hex position
                     if system_trajectory_start_x is not None and system_trajectory_start_y is not None:
                         start_x, start_y = system_trajectory_start_x, system_trajectory_start_y
@@ -1891,14 +1893,15 @@ try:
                         sound_manager.stop_movement_sound()
                         system_trajectory_start_x, system_trajectory_start_y = None, None  # Reset system trajectory tracking
                         add_event_log(f"Arrived at system hex ({system_dest_q}, {system_dest_r}) - Energy: {int(player_ship.warp_core_energy)}/{int(player_ship.max_warp_core_energy)}")
-                        print(f"System ship arrived at hex ({system_dest_q}, {system_dest_r})")
+                        if DEBUG_UI:
+                            print(f"System ship arrived at hex ({system_dest_q}, {system_dest_r})")
                         
                         # Check for starbase docking at this hex
                         system_objects = systems.get(current_system, [])
                         for obj in system_objects:
                             if obj.type == 'starbase':
                                 # Check if player is at the starbase center hex
-                                if hasattr(obj, 'system_q') and hasattr(obj, 'system_r'):
+                                if obj.system_q is not None and obj.system_r is not None:
                                     if obj.system_q == system_dest_q and obj.system_r == system_dest_r:
                                         # Player is at starbase center - this is main docking port
                                         add_event_log("*** DOCKING WITH STARBASE - MAIN PORT ***")
@@ -1910,8 +1913,8 @@ try:
                                 else:
                                     # Calculate if player is on one of the 6 surrounding docking pad hexes
                                     # The 6 hexes surrounding the starbase center in a flat-topped hex grid
-                                    starbase_center_q = obj.system_q if hasattr(obj, 'system_q') else 10  # Default center
-                                    starbase_center_r = obj.system_r if hasattr(obj, 'system_r') else 10
+                                    starbase_center_q = obj.system_q if obj.system_q is not None else 10  # Default center
+                                    starbase_center_r = obj.system_r if obj.system_r is not None else 10
                                     
                                     # Define the 6 adjacent hex positions around the starbase center
                                     docking_pad_positions = [
@@ -1995,7 +1998,7 @@ try:
         phaser_anim_data = game_state.weapon_animation_manager.get_phaser_animation_data(current_time)
         if phaser_anim_data and phaser_anim_data['active']:
             # Find player and enemy positions
-            player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+            player_obj = find_system_player(systems, current_system)
             if player_obj is not None:
                 # Use animated position (orbital or movement) if available, otherwise use static position
                 if system_ship_anim_x is not None and system_ship_anim_y is not None:
@@ -2057,10 +2060,9 @@ try:
         
         # OLD TORPEDO CODE (commented out for transition)
         elif False:  # game_state.combat.torpedo_flying:
-            now = pygame.time.get_ticks()
-            elapsed = now - game_state.combat.torpedo_anim_start
+            elapsed = current_time - game_state.combat.torpedo_anim_start
             # DEBUG: Add occasional debug output
-            if elapsed % 1000 < 16:  # Print every ~1 second for a few frames
+            if DEBUG_UI and elapsed % 1000 < 16:  # Print every ~1 second for a few frames
                 print(f"[DEBUG] Torpedo animation active: elapsed={elapsed}ms")
             
             if game_state.combat.torpedo_start_pos and game_state.combat.torpedo_target_pos:
@@ -2131,7 +2133,7 @@ try:
                                 
                                 if combat_result['target_destroyed']:
                                     add_event_log("Enemy ship destroyed by torpedo!")
-                                    systems[current_system].remove(game_state.combat.torpedo_target_enemy)
+                                    remove_system_object(systems, current_system, game_state.combat.torpedo_target_enemy)
                                     # Remove from targeting system
                                     destroyed_id = None
                                     for tid, tobj in game_state.combat.targeted_enemies.items():
@@ -2155,7 +2157,8 @@ try:
                                         next_enemy_id = next(iter(game_state.combat.targeted_enemies.keys()))
                                         game_state.combat.selected_enemy = game_state.combat.targeted_enemies[next_enemy_id]
                                         add_event_log(f"Auto-targeting {next_enemy_id}")
-                                        print(f"[DEBUG] Auto-selected enemy {next_enemy_id} as new target")
+                                        if DEBUG_UI:
+                                            print(f"[DEBUG] Auto-selected enemy {next_enemy_id} as new target")
                                     else:
                                         game_state.combat.selected_enemy = None
                                         add_event_log("No targets remaining")
@@ -2187,7 +2190,7 @@ try:
                 player_render_pos = (system_ship_anim_x, system_ship_anim_y)
             else:
                 # Fallback to static player position
-                player_obj = next((obj for obj in systems.get(current_system, []) if obj.type == 'player'), None)
+                player_obj = find_system_player(systems, current_system)
                 if player_obj:
                     player_render_pos = hex_grid.get_hex_center(player_obj.system_q, player_obj.system_r)
         elif game_state.map_mode == 'sector':
@@ -2227,7 +2230,8 @@ try:
 
         pygame.display.flip()
         clock.tick(FPS)
-        logging.debug(f"[LOOP] Frame complete. FPS: {clock.get_fps():.1f}")
+        if DEBUG_RENDER:
+            logging.debug("[LOOP] Frame complete. FPS: %.1f", clock.get_fps())
 
 except Exception as e:
     print("--- GAME CRASHED ---")
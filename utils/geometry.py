@@ -25,6 +25,19 @@ def hex_distance(a, b):
     return max(dq, dr, ds)
 
 
+# Neighbor offsets (dq, dr) for flat-topped hexes in offset coordinates
+_EVEN_COLUMN_NEIGHBOR_OFFSETS = (
+    (-1, -1), (-1, 0),    # Left neighbors
+    (0, -1), (0, 1),      # Top and bottom
+    (1, -1), (1, 0),      # Right neighbors
+)
+_ODD_COLUMN_NEIGHBOR_OFFSETS = (
+    (-1, 0), (-1, 1),     # Left neighbors
+    (0, -1), (0, 1),      # Top and bottom
+    (1, 0), (1, 1),       # Right neighbors
+)
+
+
 def hex_neighbors(q, r):
     """Get all 6 neighboring hexes for a given hex coordinate.
 
@@ -37,19 +50,8 @@ def hex_neighbors(q, r):
     Returns:
         list: List of 6 (q, r) tuples representing neighbor positions
     """
-    if q % 2 == 0:  # Even column
-        neighbors = [
-            (q-1, r-1), (q-1, r),    # Left neighbors
-            (q, r-1), (q, r+1),      # Top and bottom
-            (q+1, r-1), (q+1, r)     # Right neighbors
-        ]
-    else:  # Odd column
-        neighbors = [
-            (q-1, r), (q-1, r+1),    # Left neighbors
-            (q, r-1), (q, r+1),      # Top and bottom
-            (q+1, r), (q+1, r+1)     # Right neighbors
-        ]
-    return neighbors
+    offsets = _ODD_COLUMN_NEIGHBOR_OFFSETS if q % 2 else _EVEN_COLUMN_NEIGHBOR_OFFSETS
+    return [(q + dq, r + dr) for dq, dr in offsets]
 
 
 def point_distance(p1, p2):